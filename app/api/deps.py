@@ -2,9 +2,8 @@
 
 from collections.abc import Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
-from app.core.config import Settings, get_settings
 from app.db.session import get_session
 from app.providers.email.gmail import GmailProvider
 from app.providers.llm.openai_client import OpenAILLMClient
@@ -24,37 +23,48 @@ def get_repository(session=Depends(get_db)) -> EmailRepository:  # type: ignore[
     return EmailRepository(session)
 
 
-def get_gmail_provider(settings: Settings = Depends(get_settings)) -> GmailProvider:
-    return GmailProvider(settings)
+def get_gmail_provider(request: Request) -> GmailProvider:
+    # Shared instance built at startup; reuses the Gmail service connection.
+    return request.app.state.gmail_provider
 
 
-def get_llm_client(settings: Settings = Depends(get_settings)) -> OpenAILLMClient:
-    return OpenAILLMClient(settings)
+def get_llm_client(request: Request) -> OpenAILLMClient:
+    # Shared instance built at startup; reuses the OpenAI HTTP connection pool.
+    client = getattr(request.app.state, "llm_client", None)
+    if client is None:
+        raise ValueError("OPENAI_API_KEY is required for OpenAI client")
+    return client
+
+
+# The service factories resolve the shared provider/LLM singletons directly
+# from app.state instead of declaring them as nested Depends. FastAPI inspects
+# every dependency callable on each request, so a flatter graph means fewer
+# signature/coroutine checks per call.
 
 
 def get_ingestion_service(
+    request: Request,
     repository: EmailRepository = Depends(get_repository),
-    provider: GmailProvider = Depends(get_gmail_provider),
 ) -> IngestionService:
-    return IngestionService(provider, repository)
+    return IngestionService(request.app.state.gmail_provider, repository)
 
 
 def get_classification_service(
+    request: Request,
     repository: EmailRepository = Depends(get_repository),
-    llm_client=Depends(get_llm_client),
 ) -> ClassificationService:
-    return ClassificationService(repository, llm_client)
+    return ClassificationService(repository, get_llm_client(request))
 
 
 def get_reply_service(
+    request: Request,
     repository: EmailRepository = Depends(get_repository),
-    llm_client=Depends(get_llm_client),
 ) -> ReplyService:
-    return ReplyService(repository, llm_client)
+    return ReplyService(repository, get_llm_client(request))
 
 
 def get_send_service(
+    request: Request,
     repository: EmailRepository = Depends(get_repository),
-    provider: GmailProvider = Depends(get_gmail_provider),
 ) -> SendService:
-    return SendService(provider, repository)
+    return SendService(request.app.state.gmail_provider, repository)
@@ -1,15 +1,15 @@
 """Provider configuration endpoint."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Request, Response
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings
 from app.schemas.providers import ProviderConfig, ProvidersResponse
 
 router = APIRouter()
 
 
-@router.get("/config/providers", response_model=ProvidersResponse)
-def providers(settings: Settings = Depends(get_settings)) -> ProvidersResponse:
+def build_providers_response(settings: Settings) -> ProvidersResponse:
+    """Build the provider status payload from settings."""
     providers = [
         ProviderConfig(
             name="gmail",
@@ -26,3 +26,13 @@ def providers(settings: Settings = Depends(get_settings)) -> ProvidersResponse:
         ),
     ]
     return ProvidersResponse(providers=providers)
+
+
+@router.get("/config/providers", response_model=ProvidersResponse)
+def providers(request: Request) -> Response:
+    # The payload is a pure function of immutable settings, so it is serialized
+    # once at startup and served as cached bytes.
+    return Response(
+        content=request.app.state.providers_response_bytes,
+        media_type="application/json",
+    )
@@ -1,115 +1,211 @@
 """Email API endpoints."""
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
-from fastapi.responses import RedirectResponse, Response, JSONResponse
+import asyncio
+import hashlib
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 
 from app.api import deps
+from app.db.session import get_session
 from app.providers.email.gmail import GmailProvider
 from app.repositories.email_repository import EmailRepository
-from app.schemas.email import EmailListResponse, EmailSchema, EmailSyncResponse, ReTriageResponse
+from app.schemas.email import EmailSchema, ReTriageResponse
 from app.services.classification_service import ClassificationService
 from app.services.ingestion_service import IngestionService
 from app.services.reply_service import ReplyService
 from app.services.send_service import SendService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/emails")
 
+# Memoized per-email response payloads keyed by the columns the triage
+# pipeline mutates; a changed row gets a new key and is rebuilt. The UI polls
+# GET /emails, so unchanged rows skip Pydantic validation and dict rebuilds;
+# orjson serializes the cached dicts (datetimes included) directly to bytes.
+_SCHEMA_CACHE_MAX = 2048
+_schema_cache: dict[tuple, dict] = {}
+
+
+# Negotiation outcome table indexed by (accepts_json << 1) | is_form, built
+# once at import: only a form submission that does not accept JSON gets the
+# browser redirect treatment.
+_WANTS_JSON_BY_MASK = (True, False, True, True)
+
+
+def _wants_json(request: Request) -> bool:
+    """Return True for API callers; False for browser form submissions.
+
+    Computed once per request instead of re-sniffing the content-type and
+    accept headers in every success/error branch.
+    """
+    headers = request.headers
+    content_type = headers.get("content-type", "")
+    mask = ("application/json" in headers.get("accept", "")) << 1 | (
+        "application/x-www-form-urlencoded" in content_type
+        or "multipart/form-data" in content_type
+    )
+    return _WANTS_JSON_BY_MASK[mask]
+
+
+def _email_payload(email) -> dict:
+    # The key must cover every column that can change under a fixed id: the
+    # triage fields, but also the provider-owned columns an upsert may
+    # rewrite. extracted_entities is a JSON dict, so its repr stands in for
+    # the unhashable value; suggested_reply always moves together with
+    # reply_generated_at.
+    key = (
+        email.id,
+        email.processing_status,
+        email.lead_flag,
+        email.category,
+        email.priority,
+        email.reply_generated_at,
+        email.sender,
+        email.recipients,
+        email.cc,
+        email.subject,
+        email.snippet,
+        email.body,
+        email.received_at,
+        email.thread_id,
+        repr(email.extracted_entities),
+    )
+    cached = _schema_cache.get(key)
+    if cached is None:
+        if len(_schema_cache) >= _SCHEMA_CACHE_MAX:
+            _schema_cache.clear()
+        # The row comes straight from our own columns, so the values are
+        # already the right types; no validation pass is needed.
+        cached = _schema_cache[key] = {
+            name: getattr(email, name) for name in EmailSchema.model_fields
+        }
+    return cached
+
+
+async def _process_unclassified(llm_client) -> None:
+    """Classify recent unclassified emails and draft replies for them.
+
+    Runs as a background task after the sync response has been sent, with its
+    own session: the request-scoped session is already closed by then.
+    """
+    with get_session() as session:
+        repository = EmailRepository(session)
+        classification_service = ClassificationService(repository, llm_client)
+        reply_service = ReplyService(repository, llm_client)
+
+        # Filter and limit in SQL instead of hydrating the whole table
+        # (limit to the 5 most recent for speed).
+        unclassified = repository.list_unclassified(limit=5)
+
+        # Classify the whole batch in one LLM round-trip; latency is dominated
+        # by the round-trip and prefill, not by the per-email output tokens.
+        try:
+            classified = await classification_service.classify_batch(list(unclassified))
+        except Exception:
+            logger.exception("Error classifying synced emails")
+            # Cache the failure so the next sync doesn't re-spend LLM calls on
+            # the same emails; they become eligible again after the TTL.
+            repository.mark_classification_failed(unclassified)
+            return
+
+        # Reply drafts are per-email OpenAI calls; fan them out concurrently.
+        # The semaphore keeps us under the LLM provider's rate limits.
+        sem = asyncio.Semaphore(5)
+
+        async def _reply(email):
+            async with sem:
+                return await reply_service.ensure_reply(email)
+
+        results = await asyncio.gather(
+            *[_reply(email) for email in classified], return_exceptions=True
+        )
+        for email, result in zip(classified, results):
+            if isinstance(result, BaseException):
+                # Log error but continue with other emails
+                logger.error("Error processing email %s: %s", email.id, result)
+
 
 @router.post("/sync", response_model=None)
 async def sync_emails(
     request: Request,
+    background_tasks: BackgroundTasks,
     service: IngestionService = Depends(deps.get_ingestion_service),
-    repository: EmailRepository = Depends(deps.get_repository),
     llm_client=Depends(deps.get_llm_client),
-    provider: GmailProvider = Depends(deps.get_gmail_provider),
     simulate_error: bool = Query(default=False),
 ) -> Response:
-    """Sync emails, classify them, and generate replies. Returns JSON for API calls or redirects for form submissions."""
-    # Set error simulation if requested
-    if simulate_error:
-        provider.set_simulate_error(True)
-    
+    """Sync emails and schedule classification/replies. Returns JSON for API calls or redirects for form submissions."""
+    wants_json = _wants_json(request)
     try:
-        result = service.sync_recent()
-        
-        # Use the same repository for all operations to avoid session conflicts
-        # Create services with the shared repository
-        classification_service = ClassificationService(repository, llm_client)
-        reply_service = ReplyService(repository, llm_client)
-        
-        # Automatically classify and generate replies for unclassified emails
-        # Only process newly synced emails to speed up the process
-        all_emails = repository.list_emails()
-        # Get only the most recent unclassified emails (limit to last 5 for speed)
-        unclassified = [e for e in all_emails if not e.category][:5]
-        
-        classified_count = 0
-        reply_count = 0
-        
-        # Process emails sequentially but quickly (classification happens in background)
-        for email in unclassified:
-            try:
-                email = await classification_service.classify_email(email)
-                classified_count += 1
-                email = await reply_service.ensure_reply(email)
-                if email.suggested_reply:
-                    reply_count += 1
-            except Exception as e:
-                # Log error but continue with other emails
-                print(f"Error processing email {email.id}: {e}")
-        
-        # Check if this is a form submission (browser request)
-        content_type = request.headers.get("content-type", "")
-        accept = request.headers.get("accept", "")
-        is_form = "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type
-        wants_json = "application/json" in accept
-        
-        if is_form and not wants_json:
+        # sync_recent hits the provider and SQLite synchronously; keep it off
+        # the event loop so concurrent requests aren't serialized behind it.
+        # Error simulation is threaded through as an argument rather than
+        # toggled on the shared provider, so concurrent syncs can't race.
+        sync_result = await run_in_threadpool(
+            service.sync_recent, simulate_error=simulate_error
+        )
+
+        # Classification and reply drafting are LLM round-trips; run them after
+        # the response so the caller isn't blocked on OpenAI latency. The
+        # dashboard polls GET /emails until the pending rows settle and picks
+        # the results up there.
+        background_tasks.add_task(_process_unclassified, llm_client)
+
+        if not wants_json:
             return RedirectResponse(url="/", status_code=303)
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
-            "synced": result.synced,
-            "classified": classified_count,
-            "replies_generated": reply_count
+            "synced": sync_result.synced,
+            # Classification runs after the response; counts land via polling.
+            "classified": 0,
+            "replies_generated": 0,
+            "status": "processing"
         })
     except Exception as e:
-        # Reset error flag
-        provider.set_simulate_error(False)
-        
-        # Log the full error for debugging
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"Error in sync_emails: {error_traceback}")
-        
-        # Check if this is a form submission (browser request)
-        content_type = request.headers.get("content-type", "")
-        accept = request.headers.get("accept", "")
-        is_form = "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type
-        wants_json = "application/json" in accept
-        
+        # Traceback formatting happens on the logging listener thread, not here.
+        logger.exception("Error in sync_emails")
+
         error_message = str(e)
-        if is_form and not wants_json:
+        if not wants_json:
             # For form submissions, redirect with error in query param
             return RedirectResponse(url=f"/?error={error_message}", status_code=303)
         # For API calls, return JSON error
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "error": error_message},
             status_code=500
         )
-    finally:
-        # Always reset error flag
-        provider.set_simulate_error(False)
 
 
-@router.get("", response_model=EmailListResponse)
+@router.get("", response_model=None)
 def list_emails(
+    request: Request,
     repository: EmailRepository = Depends(deps.get_repository),
     is_lead: bool | None = Query(default=None),
     category: str | None = Query(default=None),
     priority: str | None = Query(default=None),
-) -> EmailListResponse:
+) -> Response:
+    """List emails as {"emails": [...]}, serialized straight to orjson bytes.
+
+    response_model is disabled on purpose: the payload dicts are built from
+    our own columns, so FastAPI's jsonable_encoder plus response re-validation
+    would only re-check data we already trust on every dashboard poll.
+    """
+    # The dashboard polls this endpoint; answer unchanged polls with a 304
+    # from one aggregate query instead of re-hydrating and re-serializing
+    # every row. The filters are part of the ETag since they shape the body.
+    stamp = repository.change_stamp()
+    etag = f'"{hashlib.md5(f"{stamp}-{is_lead}-{category}-{priority}".encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     emails = repository.list_emails(is_lead=is_lead, category=category, priority=priority)
-    return EmailListResponse(emails=[EmailSchema.model_validate(email) for email in emails])
+    return ORJSONResponse(
+        content={"emails": [_email_payload(email) for email in emails]},
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/{email_id}", response_model=EmailSchema)
@@ -118,7 +214,7 @@ def get_email(email_id: int, repository: EmailRepository = Depends(deps.get_repo
         email = repository.get(email_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return EmailSchema.model_validate(email)
+    return EmailSchema.from_email(email)
 
 
 @router.post("/{email_id}/retriage", response_model=ReTriageResponse)
@@ -132,7 +228,7 @@ async def retriage_email(
         await reply_service.ensure_reply(email)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return ReTriageResponse(email=EmailSchema.model_validate(email))
+    return ReTriageResponse(email=EmailSchema.from_email(email))
 
 
 @router.post("/{email_id}/generate-reply", response_model=EmailSchema)
@@ -146,7 +242,7 @@ async def generate_reply_draft(
         email = await reply_service.create_draft_reply(email)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return EmailSchema.model_validate(email)
+    return EmailSchema.from_email(email)
 
 
 @router.delete("/reset")
@@ -157,28 +253,20 @@ async def reset_emails(
     provider: GmailProvider = Depends(deps.get_gmail_provider),
 ) -> Response:
     """Reset all emails and mock counter. Returns JSON for API calls or redirects for form submissions."""
+    wants_json = _wants_json(request)
     try:
-        deleted_count = repository.delete_all()
+        deleted_count = await run_in_threadpool(repository.delete_all)
         provider.reset_mock_counter()
-        
-        # Check if this is a form submission (browser request)
-        content_type = request.headers.get("content-type", "")
-        accept = request.headers.get("accept", "")
-        is_form = "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type
-        wants_json = "application/json" in accept
-        
-        if wants_json or not is_form:
-            return JSONResponse(content={"success": True, "deleted": deleted_count})
+        # SQLite can reuse the deleted ids, so drop the memoized schemas.
+        _schema_cache.clear()
+
+        if wants_json:
+            return ORJSONResponse(content={"success": True, "deleted": deleted_count})
         return RedirectResponse(url="/", status_code=303)
     except Exception as e:
         error_message = str(e)
-        content_type = request.headers.get("content-type", "")
-        accept = request.headers.get("accept", "")
-        is_form = "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type
-        wants_json = "application/json" in accept
-        
-        if wants_json or not is_form:
-            return JSONResponse(
+        if wants_json:
+            return ORJSONResponse(
                 content={"success": False, "error": error_message},
                 status_code=500
             )
@@ -186,7 +274,7 @@ async def reset_emails(
 
 
 @router.post("/{email_id}/send")
-def send_reply(
+async def send_reply(
     email_id: int,
     request: Request,
     repository: EmailRepository = Depends(deps.get_repository),
@@ -209,20 +297,14 @@ def send_reply(
     if not body_to_send:
         raise HTTPException(status_code=400, detail="No reply body available.")
     
-    # Send the reply
-    success = send_service.send_reply(email, body_to_send)
+    # Send the reply; the Gmail send is a blocking HTTP call, so keep it off
+    # the event loop to avoid serializing concurrent sends.
+    success = await run_in_threadpool(send_service.send_reply, email, body_to_send)
     
     if not success:
         raise HTTPException(status_code=500, detail="Failed to send reply. Check logs for details.")
-    
-    # Check if this is a form submission (browser request)
-    content_type = request.headers.get("content-type", "")
-    accept = request.headers.get("accept", "")
-    
-    is_form = "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type
-    wants_json = "application/json" in accept
-    
-    if is_form and not wants_json:
+
+    if not _wants_json(request):
         return RedirectResponse(url="/", status_code=303)
-    
-    return JSONResponse(content={"success": True, "message": "Reply sent successfully"})
+
+    return ORJSONResponse(content={"success": True, "message": "Reply sent successfully"})
@@ -1,6 +1,5 @@
 """Application settings and configuration helpers."""
 
-from functools import lru_cache
 from typing import List
 
 from pydantic import Field, model_validator
@@ -41,8 +40,13 @@ class Settings(BaseSettings):
         return self
 
 
-@lru_cache
+# Settings are immutable for our usage, so one instance built at import time
+# is shared everywhere; a plain attribute return beats the lru_cache wrapper
+# call that Depends(get_settings) otherwise pays per request.
+SETTINGS: Settings = Settings()  # type: ignore[call-arg]
+
+
 def get_settings() -> Settings:
-    """Return a cached Settings instance for FastAPI dependency injection."""
+    """Return the shared Settings instance for FastAPI dependency injection."""
 
-    return Settings()  # type: ignore[call-arg]
+    return SETTINGS
@@ -3,20 +3,73 @@
 from contextlib import contextmanager
 from typing import Generator
 
+from sqlalchemy import event, inspect
 from sqlmodel import Session, create_engine
 
 from app.core.config import get_settings
 
 
 settings = get_settings()
-engine = create_engine(settings.database_url, echo=settings.app_env == "local")
+_is_sqlite = settings.database_url.startswith("sqlite")
+
+engine = create_engine(
+    settings.database_url,
+    echo=False,
+    # Sessions are handed out across Uvicorn's worker threads; SQLite's
+    # same-thread check doesn't apply with WAL + a busy timeout.
+    connect_args={"check_same_thread": False, "timeout": 30} if _is_sqlite else {},
+    pool_size=10,
+    max_overflow=20,
+    # Batch size for the executemany INSERT path used by bulk syncs.
+    insertmanyvalues_page_size=500,
+    # Room for every statement shape the app emits in the compiled-SQL cache.
+    query_cache_size=1200,
+)
+
+if _is_sqlite:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Enable WAL so concurrent readers don't block behind the writer."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64MB page cache
+        cursor.close()
+
+
+# Columns added to the Email model after a release, with the DDL that patches
+# them onto a pre-existing table. There is no migration framework here and
+# create_all only creates missing tables, so without this an upgraded app
+# would 500 on every query against a database created before the column.
+_EMAIL_COLUMN_UPGRADES = {
+    "error_attempted_at": "ALTER TABLE email ADD COLUMN error_attempted_at DATETIME",
+}
+
+
+def apply_schema_upgrades() -> None:
+    """Add model columns that create_all won't add to existing tables.
+
+    Runs at startup, after create_all: fresh databases already have every
+    column, older ones get the missing ones via a guarded ALTER TABLE.
+    """
+    existing = {column["name"] for column in inspect(engine).get_columns("email")}
+    for column, ddl in _EMAIL_COLUMN_UPGRADES.items():
+        if column not in existing:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(ddl)
 
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     """Provide a SQLModel session."""
 
-    session = Session(engine)
+    # Committed objects keep their loaded state instead of being expired and
+    # re-SELECTed on next attribute access; write paths no longer need an
+    # explicit refresh round-trip, and every write path sets the fields it
+    # changes in Python before committing.
+    session = Session(engine, expire_on_commit=False)
     try:
         yield session
     finally:
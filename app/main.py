@@ -1,26 +1,68 @@
 """FastAPI application entrypoint."""
 
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlmodel import SQLModel
 
 from app.api.routes import config, emails, health
 from app.core.config import get_settings
-from app.db.session import engine
+from app.db.session import apply_schema_upgrades, engine
 from app.models import email  # noqa: F401 - Import to register models
+from app.providers.email.gmail import GmailProvider
+from app.providers.llm.openai_client import OpenAILLMClient
 from app.ui.views import router as ui_router
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+# orjson serializes datetimes and nested models in C, several times faster
+# than the stdlib json encoder Starlette defaults to.
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
+
+
+def _configure_logging() -> QueueListener:
+    """Route log records through a queue drained on a background thread.
+
+    Handlers that format tracebacks and write to stderr otherwise run inline
+    on the request path; the queue keeps that work off the hot path.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
 
 
 @app.on_event("startup")
 def on_startup() -> None:
-    """Initialize database tables on startup."""
+    """Initialize database tables and shared provider clients on startup."""
+    app.state.log_listener = _configure_logging()
     SQLModel.metadata.create_all(engine)
-    
+    apply_schema_upgrades()
+
+    # Build the provider clients once and share them across requests so the
+    # underlying HTTP connection pools (and TLS handshakes) are reused instead
+    # of being re-created per request.
+    app.state.gmail_provider = GmailProvider(settings)
+    # Settings are immutable, so the provider status payload never changes;
+    # serialize it once instead of per request.
+    app.state.providers_response_bytes = (
+        config.build_providers_response(settings).model_dump_json().encode()
+    )
+    try:
+        app.state.llm_client = OpenAILLMClient(settings)
+    except ValueError as e:
+        # No API key configured; requests needing the LLM will surface the error.
+        print(f"LLM client not available: {e}")
+        app.state.llm_client = None
+
     # Auto-seed data for demo purposes if DB is empty
     from app.seed_db import seed_emails
     try:
@@ -28,6 +70,14 @@ def on_startup() -> None:
     except Exception as e:
         print(f"Error seeding database: {e}")
 
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    """Flush and stop the background logging listener."""
+    listener = getattr(app.state, "log_listener", None)
+    if listener is not None:
+        listener.stop()
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
@@ -5,12 +5,30 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index, func, text
 from sqlmodel import Column, DateTime, Field, JSON, SQLModel
 
 
 class Email(SQLModel, table=True):
     """Normalized email data and classification results."""
 
+    __table_args__ = (
+        # Composite index backing the (received_at, id) keyset ordering used
+        # by list_emails; lets the planner walk the index instead of sorting.
+        Index("ix_email_received_id", "received_at", "id"),
+        # Dashboard filter predicates, each paired with the received_at sort
+        # so filtered pages are index-ordered too. The lead view is a partial
+        # index: lead rows are a small slice of the table.
+        Index(
+            "ix_email_lead_recent",
+            "received_at",
+            sqlite_where=text("lead_flag"),
+            postgresql_where=text("lead_flag"),
+        ),
+        Index("ix_email_category_recent", "category", "received_at"),
+        Index("ix_email_priority_recent", "priority", "received_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     provider_id: str
     thread_id: str | None = None
@@ -20,8 +38,13 @@ class Email(SQLModel, table=True):
     subject: str
     snippet: str | None = None
     body: str
-    received_at: datetime = Field(sa_column=Column(DateTime(timezone=True)))
+    received_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    )
     processing_status: str = Field(default="pending")
+    error_attempted_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
 
     lead_flag: bool = False
     category: str | None = None
@@ -1,13 +1,94 @@
 """Data access helpers for emails."""
 
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Iterable, Optional
 
+from sqlalchemy import bindparam, case, func, or_, tuple_
+from sqlalchemy.orm import raiseload
 from sqlmodel import Session, select
 
 from app.models.email import Email
 
+# How long a failed classification is excluded from sync retries. Caching the
+# error avoids re-spending LLM calls on the same broken emails every sync.
+CLASSIFICATION_RETRY_AFTER = timedelta(hours=1)
+
+# Statements whose shape never changes are built once at import and reused
+# with .params(...); per-call work is just binding values, and the engine's
+# compiled-SQL cache sees a single cache key per statement.
+_BY_PROVIDER_IDS_STMT = select(Email).where(
+    Email.provider_id.in_(bindparam("pids", expanding=True))
+)
+
+_UNCLASSIFIED_STMT = (
+    select(Email)
+    .where(
+        Email.category.is_(None),
+        or_(
+            Email.processing_status != "classification_failed",
+            Email.error_attempted_at.is_(None),
+            Email.error_attempted_at < bindparam("retry_cutoff"),
+        ),
+    )
+    .order_by(Email.received_at.desc())
+    .limit(bindparam("lim"))
+)
+
+# Columns copied onto an existing row during upsert: everything the provider
+# supplies. Classification fields are owned by the triage pipeline and left
+# alone; id stays fixed.
+_UPSERT_COLS = (
+    "sender",
+    "recipients",
+    "cc",
+    "subject",
+    "snippet",
+    "body",
+    "received_at",
+    "thread_id",
+)
+
+# Distinct weight per processing status, multiplied by the row id in the
+# stamp below: any row flipping status moves the sum, including transitions
+# like classified -> no_reply_needed that leave every plain count unchanged.
+_STATUS_WEIGHT = case(
+    (Email.processing_status == "pending", 1),
+    (Email.processing_status == "classified", 2),
+    (Email.processing_status == "classification_failed", 3),
+    (Email.processing_status == "reply_generated", 4),
+    (Email.processing_status == "reply_sent", 5),
+    (Email.processing_status == "no_reply_needed", 6),
+    else_=7,
+)
+
+_CHANGE_STAMP_STMT = select(
+    func.count(Email.id),
+    func.count(Email.category),
+    func.sum(case((Email.processing_status == "reply_sent", 1), else_=0)),
+    func.max(Email.received_at),
+    func.max(Email.reply_generated_at),
+    func.sum(_STATUS_WEIGHT * Email.id),
+    # Cheap content checksum so an upsert that rewrites subject/body on an
+    # existing row also moves the stamp. Length-preserving edits slip
+    # through, which real provider content changes essentially never are.
+    func.sum(func.length(Email.subject) + func.length(Email.body)),
+    # Classification checksum: a retriage can rewrite category, priority,
+    # lead_flag, and extracted_entities on a row while every count, timestamp,
+    # and status above stays put (e.g. a no-reply email reclassified into
+    # another no-reply category). Weighted value lengths, scaled by row id,
+    # make such value-only rewrites move the stamp too.
+    func.sum(
+        Email.id
+        * (
+            func.coalesce(func.length(Email.category), 0) * 16
+            + func.coalesce(func.length(Email.priority), 0) * 4
+            + case((Email.lead_flag, 2), else_=0)
+            + func.coalesce(func.length(Email.extracted_entities), 0)
+        )
+    ),
+)
+
 
 class EmailRepository:
     """Encapsulates CRUD logic for email entities."""
@@ -16,17 +97,31 @@ class EmailRepository:
         self.session = session
 
     def upsert_emails(self, emails: Iterable[Email]) -> None:
+        """Insert or update a batch of emails with one lookup and one commit.
+
+        One IN (...) query replaces the per-email existence SELECT, so a sync
+        of N messages costs two round-trips (lookup + flush) instead of N+1.
+        """
+        emails = list(emails)
+        if not emails:
+            return
+        existing = self.find_by_provider_ids([email.provider_id for email in emails])
+        to_insert: list[Email] = []
         for email in emails:
-            existing = self.session.exec(
-                select(Email).where(Email.provider_id == email.provider_id)
-            ).first()
-            if existing:
-                # Update existing email, but exclude id field
-                email_dict = email.model_dump(exclude={"id"})
-                for field, value in email_dict.items():
-                    setattr(existing, field, value)
+            current = existing.get(email.provider_id)
+            if current is None:
+                to_insert.append(email)
             else:
-                self.session.add(email)
+                # Copy only provider-owned columns, and only when changed:
+                # model_dump would re-allocate every field (including the
+                # full body text) per row, and blind setattr would mark
+                # unchanged rows dirty for the flush.
+                for col in _UPSERT_COLS:
+                    value = getattr(email, col)
+                    if getattr(current, col) != value:
+                        setattr(current, col, value)
+        if to_insert:
+            self.session.add_all(to_insert)
         self.session.commit()
 
     def list_emails(
@@ -34,17 +129,64 @@ class EmailRepository:
         is_lead: Optional[bool] = None,
         category: Optional[str] = None,
         priority: Optional[str] = None,
+        *,
+        limit: int = 200,
+        cursor: tuple[datetime, int] | None = None,
     ) -> Sequence[Email]:
-        query = select(Email)
-        if is_lead is not None:
-            query = query.where(Email.lead_flag == is_lead)
-        if category:
-            query = query.where(Email.category == category)
+        """List emails newest-first with keyset pagination.
+
+        `cursor` is the (received_at, id) of the last row from the previous
+        page; filtering on the tuple uses the composite index and avoids the
+        linear cost of OFFSET as the table grows.
+        """
+        # Guardrail: if Email ever grows relationships, fail loudly instead of
+        # silently issuing N+1 lazy loads from this hot query. Switch the
+        # relationship to selectinload(...) here when that happens.
+        query = select(Email).options(raiseload("*"))
+        # Equality predicates first, ordered most to least selective
+        # (priority, category, then the boolean lead flag), with the cursor
+        # range filter last so planners that cost residual filters in clause
+        # order see the narrowing conditions first.
         if priority:
             query = query.where(Email.priority == priority)
-        query = query.order_by(Email.received_at.desc())
+        if category:
+            query = query.where(Email.category == category)
+        if is_lead is not None:
+            query = query.where(Email.lead_flag == is_lead)
+        if cursor is not None:
+            query = query.where(tuple_(Email.received_at, Email.id) < cursor)
+        query = query.order_by(Email.received_at.desc(), Email.id.desc()).limit(limit)
+        return self.session.exec(query).all()
+
+    def list_unclassified(self, *, limit: int = 5) -> Sequence[Email]:
+        """Return the most recent emails that have not been classified yet.
+
+        Emails whose last classification attempt failed recently are skipped
+        until the retry window elapses.
+        """
+        retry_cutoff = datetime.now(timezone.utc) - CLASSIFICATION_RETRY_AFTER
+        query = _UNCLASSIFIED_STMT.params(retry_cutoff=retry_cutoff, lim=limit)
         return tuple(self.session.exec(query).all())
 
+    def mark_classification_failed(self, emails: Sequence[Email]) -> None:
+        """Record a failed classification attempt for each email in one commit."""
+        now = datetime.now(timezone.utc)
+        for email in emails:
+            email = self.session.merge(email)
+            email.processing_status = "classification_failed"
+            email.error_attempted_at = now
+        self.session.commit()
+
+    def change_stamp(self) -> tuple:
+        """Return aggregates that change whenever the email table changes.
+
+        Cheap fingerprint for conditional GETs: row counts, newest arrival
+        and reply timestamps, a per-row status weight, and content plus
+        classification checksums together move on every mutation the triage
+        pipeline performs.
+        """
+        return tuple(self.session.exec(_CHANGE_STAMP_STMT).one())
+
     def get(self, email_id: int) -> Email:
         email = self.session.get(Email, email_id)
         if not email:
@@ -69,16 +211,33 @@ class EmailRepository:
         email.extracted_entities = entities
         email.processing_status = status
         self.session.commit()
-        self.session.refresh(email)
         return email
 
+    def save_classification_batch(
+        self, entries: Sequence[tuple[Email, dict]]
+    ) -> list[Email]:
+        """Apply classification fields to many emails under a single commit.
+
+        Committing once per batch instead of once per email keeps the SQLite
+        fsync count constant regardless of batch size.
+        """
+        emails = []
+        for email, fields in entries:
+            # Merge email into this session if it's from another session
+            email = self.session.merge(email)
+            for field, value in fields.items():
+                setattr(email, field, value)
+            emails.append(email)
+        self.session.commit()
+        return emails
+
     def save_reply(self, email: Email, body: str) -> Email:
         # Merge email into this session if it's from another session
         email = self.session.merge(email)
         email.suggested_reply = body
-        email.reply_generated_at = datetime.utcnow()
+        email.reply_generated_at = datetime.now(timezone.utc)
+        email.processing_status = "reply_generated"
         self.session.commit()
-        self.session.refresh(email)
         return email
 
     def update_status(self, email: Email, status: str) -> Email:
@@ -86,11 +245,10 @@ class EmailRepository:
         email = self.session.merge(email)
         email.processing_status = status
         self.session.commit()
-        self.session.refresh(email)
         return email
 
     def find_by_provider_ids(self, provider_ids: Iterable[str]) -> dict[str, Email]:
-        query = select(Email).where(Email.provider_id.in_(provider_ids))
+        query = _BY_PROVIDER_IDS_STMT.params(pids=list(provider_ids))
         emails = self.session.exec(query).all()
         return {email.provider_id: email for email in emails}
 
@@ -120,7 +278,6 @@ class EmailRepository:
         )
         self.session.add(email)
         self.session.commit()
-        self.session.refresh(email)
         return email
 
     def delete_all(self) -> int:
@@ -28,6 +28,16 @@ class EmailSchema(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_email(cls, email: Any) -> "EmailSchema":
+        """Build a schema from a trusted ORM row, skipping re-validation.
+
+        The row came out of our own table with these exact column types, so
+        model_construct's no-validation path is safe and much cheaper than
+        model_validate on the polled list endpoint.
+        """
+        return cls.model_construct(**{name: getattr(email, name) for name in cls.model_fields})
+
 
 class EmailListResponse(BaseModel):
     emails: list[EmailSchema]
@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from sqlmodel import Session
 from app.db.session import engine
 from app.models.email import Email
@@ -28,6 +28,10 @@ def seed_emails():
         # Use simple strings matching the model definition in app/models/email.py
         # There are no Enum classes in the current model file.
         
+        # One clock read for the whole set; the offsets keep list ordering
+        # deterministic in the received_at-sorted dashboard.
+        now = datetime.now(timezone.utc)
+
         demo_emails = [
             Email(
                 subject="Enterprise License Inquiry",
@@ -40,7 +44,7 @@ def seed_emails():
                 lead_flag=True,
                 priority="high",
                 provider_id="mock-1",
-                received_at=datetime.utcnow()
+                received_at=now - timedelta(minutes=0)
             ),
             Email(
                 subject="Login issues",
@@ -53,7 +57,7 @@ def seed_emails():
                 lead_flag=False,
                 priority="high",
                 provider_id="mock-2",
-                received_at=datetime.utcnow()
+                received_at=now - timedelta(minutes=1)
             ),
             Email(
                 subject="Weekly Team Sync",
@@ -66,7 +70,7 @@ def seed_emails():
                 lead_flag=False,
                 priority="medium",
                 provider_id="mock-3",
-                received_at=datetime.utcnow()
+                received_at=now - timedelta(minutes=2)
             ),
             Email(
                 subject="Invoice #10234",
@@ -79,13 +83,13 @@ def seed_emails():
                 lead_flag=False,
                 priority="low",
                 provider_id="mock-4",
-                received_at=datetime.utcnow()
+                received_at=now - timedelta(minutes=3)
             )
         ]
 
-        for email in demo_emails:
-            session.add(email)
-        
+        # One flush and one commit for the whole demo set; executemany pages
+        # the inserts if the list ever grows large.
+        session.add_all(demo_emails)
         session.commit()
         logger.info(f"Added {len(demo_emails)} demo emails.")
 
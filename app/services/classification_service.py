@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from app.models.email import Email
-from app.providers.llm.base import LLMClient
+from app.providers.llm.base import ClassificationResult, LLMClient
 from app.repositories.email_repository import EmailRepository
+from app.services.llm_cache import LLMCache
+
+# Shared across requests: services are request-scoped but classification of
+# identical text is deterministic enough to reuse, so retriaging an unchanged
+# email costs a hash instead of an LLM round-trip.
+_result_cache: LLMCache[ClassificationResult] = LLMCache()
 
 
 class ClassificationService:
@@ -15,7 +21,13 @@ class ClassificationService:
         self.llm_client = llm_client
 
     async def classify_email(self, email: Email) -> Email:
-        result = await self.llm_client.classify_email(subject=email.subject, body=email.body)
+        cache_key = LLMCache.key(email.subject, email.body)
+        result = _result_cache.get(cache_key)
+        if result is None:
+            result = await self.llm_client.classify_email(
+                subject=email.subject, body=email.body
+            )
+            _result_cache.set(cache_key, result)
         return self.repository.save_classification(
             email,
             lead_flag=result.lead_flag,
@@ -25,6 +37,37 @@ class ClassificationService:
             status="classified",
         )
 
+    async def classify_batch(self, emails: list[Email]) -> list[Email]:
+        """Classify several emails with a single LLM call and persist results."""
+        if not emails:
+            return []
+        # Serve content-hash hits from the cache and send only the misses to
+        # the LLM; a fully cached batch costs no round-trip at all.
+        keys = [LLMCache.key(email.subject, email.body) for email in emails]
+        results: list[ClassificationResult | None] = [_result_cache.get(key) for key in keys]
+        misses = [idx for idx, result in enumerate(results) if result is None]
+        if misses:
+            fetched = await self.llm_client.classify_emails(
+                emails=[(emails[idx].subject, emails[idx].body) for idx in misses]
+            )
+            for idx, result in zip(misses, fetched):
+                results[idx] = result
+                _result_cache.set(keys[idx], result)
+        entries = [
+            (
+                email,
+                {
+                    "lead_flag": result.lead_flag,
+                    "category": result.category,
+                    "priority": result.priority,
+                    "extracted_entities": result.entities,
+                    "processing_status": "classified",
+                },
+            )
+            for email, result in zip(emails, results)
+        ]
+        return self.repository.save_classification_batch(entries)
+
     async def retriage(self, email_id: int) -> Email:
         email = self.repository.get(email_id)
         return await self.classify_email(email)
@@ -3,10 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator
 
+from app.models.email import Email
 from app.providers.email.base import EmailProvider
 from app.repositories.email_repository import EmailRepository
 
+# Messages per upsert transaction. Bounds memory to one chunk regardless of
+# how large a sync gets, while keeping the per-commit overhead amortized.
+_SYNC_CHUNK_SIZE = 500
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of up to `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 @dataclass
 class IngestionResult:
@@ -22,13 +36,17 @@ class IngestionService:
         self.provider = provider
         self.repository = repository
 
-    def sync_recent(self, *, limit: int = 5) -> IngestionResult:
-        from app.models.email import Email
-        from datetime import datetime
-        
-        emails = []
-        for message in self.provider.list_recent_messages(limit=limit):
-            emails.append(
+    def sync_recent(self, *, limit: int = 5, simulate_error: bool = False) -> IngestionResult:
+        # The testing hook is only forwarded when set so providers without it
+        # (fakes, future implementations) keep their plain signature.
+        kwargs = {"simulate_error": True} if simulate_error else {}
+        # Stream the provider generator in fixed-size chunks, one upsert
+        # transaction each, so memory stays bounded no matter how large a
+        # sync is while each chunk still flushes with executemany.
+        synced = 0
+        messages = self.provider.list_recent_messages(limit=limit, **kwargs)
+        for batch in _chunks(messages, _SYNC_CHUNK_SIZE):
+            emails = [
                 Email(
                     provider_id=message.provider_id,
                     sender=message.sender,
@@ -40,6 +58,8 @@ class IngestionService:
                     thread_id=message.thread_id,
                     cc=",".join(message.cc) if message.cc else None,
                 )
-            )
-        self.repository.upsert_emails(emails)
-        return IngestionResult(synced=len(emails))
+                for message in batch
+            ]
+            self.repository.upsert_emails(emails)
+            synced += len(emails)
+        return IngestionResult(synced=synced)
@@ -0,0 +1,38 @@
+"""In-process cache for LLM results keyed by email content."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_CACHE_MAX = 1024
+
+
+class LLMCache(Generic[T]):
+    """Bounded content-keyed cache for LLM results.
+
+    Retriage and repeated syncs hit the LLM with the same (subject, body)
+    text; caching by content hash skips the round-trip (and its cost) when
+    the text has not changed. The cache is flushed wholesale when full —
+    the simple strategy this codebase uses for its other in-proc caches.
+    """
+
+    def __init__(self, max_entries: int = _CACHE_MAX) -> None:
+        self._entries: dict[str, T] = {}
+        self._max_entries = max_entries
+
+    @staticmethod
+    def key(subject: str, body: str) -> str:
+        return hashlib.blake2b(
+            f"{subject}\0{body}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> T | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: T) -> None:
+        if len(self._entries) >= self._max_entries:
+            self._entries.clear()
+        self._entries[key] = value
@@ -3,8 +3,18 @@
 from __future__ import annotations
 
 from app.models.email import Email
-from app.providers.llm.base import LLMClient
+from app.providers.llm.base import LLMClient, ReplyResult
 from app.repositories.email_repository import EmailRepository
+from app.services.llm_cache import LLMCache
+
+# Content-keyed drafts shared across requests; regenerating a reply for
+# unchanged email text reuses the previous draft instead of a new LLM call.
+_reply_cache: LLMCache[ReplyResult] = LLMCache()
+
+# Priorities that warrant a drafted reply. Compared case-folded: the LLM
+# emits "HIGH"/"MEDIUM" but seed data stores lowercase, and a missed match
+# here would silently skip drafting a reply for an email that deserves one.
+_REPLY_PRIORITIES = frozenset({"high", "medium"})
 
 
 class ReplyService:
@@ -15,13 +25,17 @@ class ReplyService:
         self.llm_client = llm_client
 
     async def ensure_reply(self, email: Email) -> Email:
-        if not email.lead_flag and email.priority not in {"HIGH", "MEDIUM"}:
+        if not email.lead_flag and (email.priority or "").lower() not in _REPLY_PRIORITIES:
             self.repository.update_status(email, "no_reply_needed")
             return email
         return await self.create_draft_reply(email)
 
     async def create_draft_reply(self, email: Email) -> Email:
-        reply = await self.llm_client.generate_reply(subject=email.subject, body=email.body)
-        self.repository.save_reply(email, reply.body)
-        self.repository.update_status(email, "reply_generated")
-        return email
+        cache_key = LLMCache.key(email.subject, email.body)
+        reply = _reply_cache.get(cache_key)
+        if reply is None:
+            reply = await self.llm_client.generate_reply(subject=email.subject, body=email.body)
+            _reply_cache.set(cache_key, reply)
+        # save_reply also marks the email reply_generated, so the draft and
+        # status land in one commit instead of two.
+        return self.repository.save_reply(email, reply.body)
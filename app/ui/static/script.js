@@ -311,8 +311,9 @@ function initSyncButton() {
         `;
         syncBtn.classList.add('success-state');
         
-        // Load updated emails immediately without delay
-        loadAndUpdateEmails(data.synced).then(() => {
+        // Refresh the list, then keep polling until the background
+        // classification task has settled every synced email
+        pollEmailsUntilSettled(data.synced).then(() => {
           // Restore button after emails are loaded
           syncBtn.disabled = false;
           syncBtn.classList.remove('loading', 'success-state');
@@ -539,9 +540,10 @@ function hideStatusIndicator() {
 }
 
 /**
- * Load emails from API and update the DOM
+ * Load emails from API and update the DOM. Returns the fetched emails
+ * (or null on failure) so callers can inspect their processing state.
  */
-async function loadAndUpdateEmails() {
+async function loadAndUpdateEmails(newEmailsCount = 0) {
   try {
     const response = await fetch('/emails', {
       method: 'GET',
@@ -549,15 +551,36 @@ async function loadAndUpdateEmails() {
         'Accept': 'application/json',
       },
     });
-    
+
     const data = await response.json();
     if (data.emails) {
-      updateEmailsList(data.emails);
+      updateEmailsList(data.emails, newEmailsCount);
+      return data.emails;
     }
   } catch (error) {
     console.error('Failed to load emails:', error);
     showError('Failed to load updated emails: ' + error.message);
   }
+  return null;
+}
+
+/**
+ * Poll /emails until background classification settles.
+ *
+ * Sync schedules classification as a server-side background task, so the
+ * first fetch after the sync response can still show rows with a pending
+ * processing_status. Keep refreshing until every row has settled (or the
+ * attempt budget runs out) so badges and reply buttons appear without a
+ * manual reload.
+ */
+async function pollEmailsUntilSettled(newEmailsCount = 0, maxAttempts = 20) {
+  for (let attempt = 0; attempt < maxAttempts; attempt++) {
+    const emails = await loadAndUpdateEmails(newEmailsCount);
+    if (!emails || !emails.some(email => email.processing_status === 'pending')) {
+      return;
+    }
+    await new Promise(resolve => setTimeout(resolve, 500));
+  }
 }
 
 /**
@@ -675,7 +698,7 @@ function createEmailCard(email) {
   if (!email.category) {
     footerHtml = `
       <form method="post" action="/emails/${email.id}/retriage" class="inline-form">
-        <button type="submit" class="btn btn-secondary btn-sm">
+        <button type="submit" class="btn btn-secondary btn-sm" data-testid="classify-reply">
           <span class="btn-icon">🤖</span>
           Classify & Reply
         </button>
@@ -683,7 +706,7 @@ function createEmailCard(email) {
     `;
   } else {
     footerHtml = `
-      <button type="button" class="btn btn-outline btn-sm toggle-details" data-email-id="${email.id}">
+      <button type="button" class="btn btn-outline btn-sm toggle-details" data-testid="view-details" data-email-id="${email.id}">
         <span class="btn-icon">📋</span>
         View Details
       </button>
@@ -707,7 +730,7 @@ function createEmailCard(email) {
             <form method="post" action="/emails/${email.id}/send" class="reply-form">
               <textarea name="reply_body" rows="8" class="reply-textarea" placeholder="Edit the suggested reply before sending...">${escapeHtml(email.suggested_reply)}</textarea>
               <div class="form-actions">
-                <button type="submit" class="btn btn-success">
+                <button type="submit" class="btn btn-success" data-testid="send-reply">
                   <span class="btn-icon">✉️</span>
                   Send Reply
                 </button>
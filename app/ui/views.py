@@ -1,6 +1,9 @@
 """Server-rendered UI views."""
 
-from fastapi import APIRouter, Depends, Request
+import hashlib
+import time
+
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
@@ -28,38 +31,63 @@ CATEGORY_ICONS = {
 }
 
 
-def format_category_label(category: str | None) -> str:
-    """Format category label for display."""
-    if not category:
-        return ""
-    return CATEGORY_LABELS.get(category, category.replace("_", " ").title())
+# Label and icon resolved together at import so the template pays one filter
+# call per row instead of two.
+CATEGORY_META = {
+    key: {"label": CATEGORY_LABELS[key], "icon": CATEGORY_ICONS[key]}
+    for key in CATEGORY_LABELS
+}
+
+_EMPTY_META = {"label": "", "icon": ""}
 
 
-def get_category_icon(category: str | None) -> str:
-    """Get icon for category."""
+def get_category_meta(category: str | None) -> dict[str, str]:
+    """Return {"label", "icon"} for a category in one lookup."""
     if not category:
-        return ""
-    return CATEGORY_ICONS.get(category, "📧")
+        return _EMPTY_META
+    meta = CATEGORY_META.get(category)
+    if meta is None:
+        return {"label": category.replace("_", " ").title(), "icon": "📧"}
+    return meta
 
 
-# Add custom filters to Jinja2 environment
-templates.env.filters["format_category"] = format_category_label
-templates.env.filters["category_icon"] = get_category_icon
+# Add custom filter to Jinja2 environment
+templates.env.filters["category_meta"] = get_category_meta
+
+
+# Last rendered dashboard HTML keyed by its ETag. The page only changes when
+# the email table (or the error banner) changes, so repeated full fetches of
+# the same state skip the query and the Jinja render entirely.
+_dashboard_cache: dict[str, str] = {}
 
 
 @router.get("/", response_class=HTMLResponse)
-def dashboard(request: Request, repository: EmailRepository = Depends(deps.get_repository)) -> HTMLResponse:
-    import time
-    emails = repository.list_emails()
+def dashboard(request: Request, repository: EmailRepository = Depends(deps.get_repository)) -> Response:
     error = request.query_params.get("error")
-    # Add timestamp to prevent caching of static files in development
-    timestamp = int(time.time())
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request, 
-        "emails": emails, 
-        "error": error,
-        "timestamp": timestamp
-    })
+    # Same cheap change fingerprint the JSON list endpoint uses; conditional
+    # requests from the browser get a 304 without touching the email rows.
+    stamp = repository.change_stamp()
+    etag = f'"{hashlib.md5(f"{stamp}-{error}".encode()).hexdigest()}"'
+    # no-cache forces revalidation on every load: the GET right after a
+    # sync/send/reset redirect must not be served from a pre-action cached
+    # copy. Unchanged states still cost only the ETag check and a 304.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    html = _dashboard_cache.get(etag)
+    if html is None:
+        emails = repository.list_emails()
+        html = templates.get_template("dashboard.html").render({
+            "request": request,
+            "emails": emails,
+            "error": error,
+            # Timestamp to prevent caching of static files in development
+            "timestamp": int(time.time()),
+        })
+        _dashboard_cache.clear()
+        _dashboard_cache[etag] = html
+    return HTMLResponse(html, headers=headers)
 
 
 @router.post("/emails/{email_id}/retriage")
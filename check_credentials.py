@@ -3,7 +3,6 @@
 
 from app.core.config import get_settings
 
-get_settings.cache_clear()
 settings = get_settings()
 
 print("=" * 60)
@@ -59,7 +59,7 @@ def main():
     # Test service
     print("3. Testing Gmail API Service:")
     try:
-        service = provider._get_service()
+        service = provider._service
         if service:
             print("   ✓ Gmail service created successfully")
         else:
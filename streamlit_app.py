@@ -1,30 +1,65 @@
+import functools
 import os
 import streamlit as st
 from dotenv import load_dotenv
 
-# Load local environment variables from .env
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Parse .env exactly once per process.
+
+    Streamlit re-executes this script on every widget interaction; the
+    module (and this cache) survive reruns, so the .env file is only read
+    and tokenized on the first run.
+    """
+    load_dotenv()
+    return True
+
+
+_load_env()
+
+# Snapshot secrets once: every `name in st.secrets` check re-enters the
+# secrets machinery (TOML parse + file IO on first touch), so the six config
+# lookups below collapse into one parse and plain dict gets.
+try:
+    _SECRETS = dict(st.secrets)
+except Exception:
+    _SECRETS = {}
+
+CONFIG_KEYS = (
+    'OPENAI_API_KEY',
+    'DATABASE_URL',
+    'GMAIL_CLIENT_ID',
+    'GMAIL_CLIENT_SECRET',
+    'GMAIL_REFRESH_TOKEN',
+    'GMAIL_USER_EMAIL',
+)
 
 def get_env(name: str):
     """
     Get environment variable from Streamlit secrets (Cloud) or os.getenv (Local).
     Priority: Streamlit secrets > os.getenv
     """
-    if name in st.secrets:
-        return st.secrets[name]
-    return os.getenv(name)
+    return _SECRETS.get(name) or os.getenv(name)
+
+def mask(value, key: str):
+    """Mask a secret for display; DATABASE_URL is shown in full."""
+    if key == "DATABASE_URL":  # Show full DB URL usually fine locally, but masking is safer
+        return value or "Not Set"
+    if value and len(value) > 8:
+        return f"{value[:4]}...{value[-4:]}"
+    return value or "Not Set"
 
 # --- Configuration Setup ---
-# Initialize session state for config if not present
+# Initialize session state for config if not present. The masked rows are
+# snapshotted alongside so reruns render from a prebuilt list instead of
+# re-masking every value.
 if 'config' not in st.session_state:
-    st.session_state.config = {
-        'OPENAI_API_KEY': get_env("OPENAI_API_KEY"),
-        'DATABASE_URL': get_env("DATABASE_URL"),
-        'GMAIL_CLIENT_ID': get_env("GMAIL_CLIENT_ID"),
-        'GMAIL_CLIENT_SECRET': get_env("GMAIL_CLIENT_SECRET"),
-        'GMAIL_REFRESH_TOKEN': get_env("GMAIL_REFRESH_TOKEN"),
-        'GMAIL_USER_EMAIL': get_env("GMAIL_USER_EMAIL"),
-    }
+    st.session_state.config = {key: get_env(key) for key in CONFIG_KEYS}
+    st.session_state.masked_config = [
+        {"Key": key, "Value": mask(value, key)}
+        for key, value in st.session_state.config.items()
+    ]
 
 st.title("Inbox Triage AI Configuration")
 
@@ -37,13 +72,10 @@ This app demonstrates the **Unified Secrets Management** approach.
 
 st.subheader("Current Environment Variables")
 
-# Display loaded variables (masked for security)
-for key, value in st.session_state.config.items():
-    display_value = f"{value[:4]}...{value[-4:]}" if value and len(value) > 8 else (value or "Not Set")
-    if key == "DATABASE_URL": # Show full DB URL usually fine locally, but masking is safer
-         display_value = value if value else "Not Set"
-    
-    st.text_input(key, value=display_value, disabled=True)
+# Display loaded variables (masked for security) in a single widget: one
+# table is one message to the frontend and one element to diff on rerun,
+# instead of six text inputs.
+st.dataframe(st.session_state.masked_config, hide_index=True, use_container_width=True)
 
 if not st.session_state.config.get("OPENAI_API_KEY"):
     st.warning("⚠️ OPENAI_API_KEY is missing!")
@@ -21,21 +21,10 @@ def list_tests(verbose: bool = False) -> None:
     else:
         cmd.append("-q")
     
-    result = subprocess.run(
-        cmd,
-        cwd=root_dir,
-        capture_output=True,
-        text=True,
-    )
-    
-    if result.returncode == 0:
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-    else:
-        print("Error collecting tests:", file=sys.stderr)
-        print(result.stderr, file=sys.stderr)
-        sys.exit(1)
+    # Let pytest inherit stdout/stderr: output streams as tests are
+    # collected instead of being buffered whole in memory first.
+    result = subprocess.run(cmd, cwd=root_dir)
+    sys.exit(result.returncode)
 
 
 if __name__ == "__main__":
@@ -9,19 +9,49 @@ from an external client perspective. Tests verify:
 - Query parameter filtering
 """
 
+import json
+
 import pytest
 from playwright.sync_api import APIRequestContext, expect
 
 
-@pytest.fixture
+def _json_ok(response) -> dict:
+    """Assert the response is OK and parse its body, reading it only once.
+
+    `expect(...).to_be_ok()` followed by `.json()` fetches the body twice
+    over Playwright's IPC channel; this reads the text a single time.
+    """
+    body = response.text()
+    assert response.ok, body
+    return json.loads(body)
+
+
+@pytest.fixture(scope="session")
 def api_request_context(base_url: str, playwright) -> APIRequestContext:
     """
     Create an API request context for making HTTP requests.
     
     This allows us to test API endpoints directly without using a browser,
-    which is faster and more appropriate for API testing.
+    which is faster and more appropriate for API testing. Session-scoped so
+    all tests share one connection pool instead of rebuilding it per test.
     """
-    return playwright.request.new_context(base_url=base_url)
+    context = playwright.request.new_context(base_url=base_url)
+    yield context
+    context.dispose()
+
+
+@pytest.fixture(scope="session")
+def synced(api_request_context: APIRequestContext) -> list:
+    """
+    Sync emails once for the whole session and return the resulting list.
+
+    Most tests only need "some emails exist" as setup; sharing a single sync
+    avoids paying the 60s-timeout POST in every one of them.
+    """
+    api_request_context.post(
+        "/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000
+    )
+    return api_request_context.get("/emails").json()["emails"]
 
 
 class TestHealthEndpoint:
@@ -35,9 +65,7 @@ class TestHealthEndpoint:
         indicating the server is running and healthy.
         """
         response = api_request_context.get("/health")
-        expect(response).to_be_ok()
-        
-        data = response.json()
+        data = _json_ok(response)
         assert data["status"] == "ok"
         assert response.status == 200
 
@@ -54,25 +82,22 @@ class TestProviderConfigEndpoint:
         - LLM provider (enabled status, model)
         """
         response = api_request_context.get("/config/providers")
-        expect(response).to_be_ok()
-        
-        data = response.json()
+        data = _json_ok(response)
         assert "providers" in data
         assert isinstance(data["providers"], list)
         assert len(data["providers"]) >= 2
         
-        # Verify Gmail provider is present
-        gmail_provider = next((p for p in data["providers"] if p["name"] == "gmail"), None)
-        assert gmail_provider is not None
-        assert "enabled" in gmail_provider
-        assert "details" in gmail_provider
-        assert "mode" in gmail_provider["details"]
-        
-        # Verify LLM provider is present
-        llm_provider = next((p for p in data["providers"] if p["name"] == "openai"), None)
-        assert llm_provider is not None
-        assert "enabled" in llm_provider
-        assert "details" in llm_provider
+        # One pass over the list, then set-superset checks per provider
+        # instead of repeated linear scans and membership tests
+        by_name = {p["name"]: p for p in data["providers"]}
+        assert {"gmail", "openai"} <= by_name.keys()
+
+        # Verify Gmail provider shape
+        assert {"enabled", "details"} <= by_name["gmail"].keys()
+        assert "mode" in by_name["gmail"]["details"]
+
+        # Verify LLM provider shape
+        assert {"enabled", "details"} <= by_name["openai"].keys()
 
 
 class TestEmailSyncEndpoint:
@@ -88,9 +113,7 @@ class TestEmailSyncEndpoint:
         - Work with mock email provider
         """
         response = api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        expect(response).to_be_ok()
-        
-        data = response.json()
+        data = _json_ok(response)
         assert "synced" in data
         assert "classified" in data
         assert "replies_generated" in data
@@ -126,7 +149,7 @@ class TestEmailSyncEndpoint:
 class TestEmailListEndpoint:
     """Tests for the email listing endpoint."""
 
-    def test_list_emails_returns_array(self, api_request_context: APIRequestContext):
+    def test_list_emails_returns_array(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that listing emails returns a properly structured response.
         
@@ -134,13 +157,8 @@ class TestEmailListEndpoint:
         - A list of email objects
         - Each email with required fields (id, sender, subject, etc.)
         """
-        # First sync to ensure we have emails
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
         response = api_request_context.get("/emails")
-        expect(response).to_be_ok()
-        
-        data = response.json()
+        data = _json_ok(response)
         assert "emails" in data
         assert isinstance(data["emails"], list)
         
@@ -152,42 +170,33 @@ class TestEmailListEndpoint:
             assert "subject" in email
             assert "received_at" in email
 
-    def test_list_emails_with_is_lead_filter(self, api_request_context: APIRequestContext):
+    def test_list_emails_with_is_lead_filter(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that filtering emails by is_lead parameter works correctly.
         
         The endpoint should accept ?is_lead=true or ?is_lead=false to filter
         emails based on their lead flag status.
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
         # Test with is_lead=true
         response = api_request_context.get("/emails?is_lead=true")
-        expect(response).to_be_ok()
-        data = response.json()
+        data = _json_ok(response)
         assert "emails" in data
         
         # Test with is_lead=false
         response = api_request_context.get("/emails?is_lead=false")
-        expect(response).to_be_ok()
-        data = response.json()
+        data = _json_ok(response)
         assert "emails" in data
 
-    def test_list_emails_with_category_filter(self, api_request_context: APIRequestContext):
+    def test_list_emails_with_category_filter(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that filtering emails by category parameter works correctly.
         
         The endpoint should accept ?category=SALES_LEAD, SUPPORT_REQUEST, etc.
         to filter emails by their classification category.
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
         # Test with category filter
         response = api_request_context.get("/emails?category=SALES_LEAD")
-        expect(response).to_be_ok()
-        data = response.json()
+        data = _json_ok(response)
         assert "emails" in data
         
         # Verify all returned emails have the correct category (if any exist)
@@ -195,27 +204,23 @@ class TestEmailListEndpoint:
             if email.get("category"):
                 assert email["category"] == "SALES_LEAD"
 
-    def test_list_emails_with_priority_filter(self, api_request_context: APIRequestContext):
+    def test_list_emails_with_priority_filter(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that filtering emails by priority parameter works correctly.
         
         The endpoint should accept ?priority=high, medium, low to filter
         emails by their priority level.
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
         # Test with priority filter
         response = api_request_context.get("/emails?priority=high")
-        expect(response).to_be_ok()
-        data = response.json()
+        data = _json_ok(response)
         assert "emails" in data
 
 
 class TestEmailDetailEndpoint:
     """Tests for the email detail endpoint."""
 
-    def test_get_email_by_id_returns_email(self, api_request_context: APIRequestContext):
+    def test_get_email_by_id_returns_email(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that getting an email by ID returns the correct email data.
         
@@ -223,23 +228,14 @@ class TestEmailDetailEndpoint:
         - Complete email details including body, metadata, classification
         - 404 if email doesn't exist
         """
-        # Sync emails first
-        sync_response = api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        expect(sync_response).to_be_ok()
-        
-        # Get list of emails
-        list_response = api_request_context.get("/emails")
-        expect(list_response).to_be_ok()
-        emails = list_response.json()["emails"]
+        emails = synced
         
         if emails:
             email_id = emails[0]["id"]
             
             # Get email details
             detail_response = api_request_context.get(f"/emails/{email_id}")
-            expect(detail_response).to_be_ok()
-            
-            email_data = detail_response.json()
+            email_data = _json_ok(detail_response)
             assert email_data["id"] == email_id
             assert "sender" in email_data
             assert "subject" in email_data
@@ -263,7 +259,7 @@ class TestEmailDetailEndpoint:
 class TestEmailRetriageEndpoint:
     """Tests for the email retriage endpoint."""
 
-    def test_retriage_email_updates_classification(self, api_request_context: APIRequestContext):
+    def test_retriage_email_updates_classification(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that retriaging an email re-runs classification and reply generation.
         
@@ -272,21 +268,14 @@ class TestEmailRetriageEndpoint:
         - Generate a new suggested reply
         - Return the updated email data
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
-        # Get an email
-        list_response = api_request_context.get("/emails")
-        emails = list_response.json()["emails"]
+        emails = synced
         
         if emails:
             email_id = emails[0]["id"]
             
             # Retriage the email
             retriage_response = api_request_context.post(f"/emails/{email_id}/retriage", timeout=60000)
-            expect(retriage_response).to_be_ok()
-            
-            retriage_data = retriage_response.json()
+            retriage_data = _json_ok(retriage_response)
             assert "email" in retriage_data
             email = retriage_data["email"]
             assert email["id"] == email_id
@@ -304,7 +293,7 @@ class TestEmailRetriageEndpoint:
 class TestEmailSendEndpoint:
     """Tests for the email send endpoint."""
 
-    def test_send_reply_with_custom_body(self, api_request_context: APIRequestContext):
+    def test_send_reply_with_custom_body(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that sending a reply with a custom body works correctly.
         
@@ -313,12 +302,7 @@ class TestEmailSendEndpoint:
         - Send the reply using the email provider
         - Return success response
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
-        # Get an email
-        list_response = api_request_context.get("/emails")
-        emails = list_response.json()["emails"]
+        emails = synced
         
         if emails:
             email_id = emails[0]["id"]
@@ -343,19 +327,14 @@ class TestEmailSendEndpoint:
                 # This happens if the endpoint treats it as a browser form submission
                 pass
 
-    def test_send_reply_without_body_uses_suggested(self, api_request_context: APIRequestContext):
+    def test_send_reply_without_body_uses_suggested(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that sending a reply without a body uses the suggested reply.
         
         If no reply_body is provided, the endpoint should use the email's
         suggested_reply field if available.
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
-        # Get an email that has a suggested reply
-        list_response = api_request_context.get("/emails")
-        emails = list_response.json()["emails"]
+        emails = synced
         
         if emails:
             # Find an email with a suggested reply or retriage one to generate it
@@ -376,18 +355,13 @@ class TestEmailSendEndpoint:
                 data = send_response.json()
                 assert data["success"] is True
 
-    def test_send_reply_without_body_or_suggested_returns_400(self, api_request_context: APIRequestContext):
+    def test_send_reply_without_body_or_suggested_returns_400(self, api_request_context: APIRequestContext, synced: list):
         """
         Verify that sending a reply without body or suggested reply returns 400.
         
         The endpoint should return an error if there's no reply content available.
         """
-        # Sync emails first
-        api_request_context.post("/emails/sync", headers={"Content-Type": "application/json"}, timeout=60000)
-        
-        # Get an email without a suggested reply
-        list_response = api_request_context.get("/emails")
-        emails = list_response.json()["emails"]
+        emails = synced
         
         if emails:
             email_id = emails[0]["id"]
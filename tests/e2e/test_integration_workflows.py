@@ -9,226 +9,234 @@ that all components work together correctly. Tests verify:
 - Error recovery and edge cases
 """
 
+import httpx
 import pytest
 from playwright.sync_api import Page, expect
 
 
+def _submit(page: Page, button, url_glob: str) -> None:
+    """Click a form button and wait for its AJAX round-trip to complete.
+
+    script.js intercepts the sync/retriage/send forms (preventDefault plus
+    fetch), so no navigation ever happens; the matching response is the
+    deterministic signal that the server-side work — including any
+    LLM-backed classification — finished. The client-side re-render
+    follows, which callers assert on with auto-retrying expectations. The
+    explicit timeout covers submits whose server work exceeds the
+    fail-fast page default.
+    """
+    with page.expect_response(url_glob, timeout=15000):
+        button.click()
+
+
+def _expect_details_visible(page: Page, toggle_button) -> str:
+    """Click a View Details toggle and wait for its panel to appear.
+
+    The toggle is a synchronous client-side show/hide; asserting on the
+    panel's visibility waits exactly as long as needed instead of a fixed
+    sleep. Returns the email id for follow-up locators.
+    """
+    email_id = toggle_button.get_attribute("data-email-id")
+    toggle_button.click()
+    expect(page.locator(f"#details-{email_id}")).to_be_visible()
+    return email_id
+
+
 class TestCompleteEmailTriageWorkflow:
     """Tests for the complete email triage workflow from sync to reply."""
 
-    def test_complete_workflow_sync_classify_view_send(self, page: Page, base_url: str):
+    def test_sync_populates_cards(self, dash: Page, base_url: str, selectors):
         """
-        Test the complete workflow: sync → classify → view → send reply.
-        
-        This is the primary user journey:
-        1. User syncs emails from inbox
-        2. System automatically classifies emails and generates replies
-        3. User views email details
-        4. User edits and sends reply
-        
-        This test ensures all steps work together seamlessly.
+        Verify that syncing via the UI populates the dashboard.
+
+        script.js re-renders the email grid from GET /emails once the sync
+        response arrives — wait on that state instead of a fixed delay.
         """
-        page.goto(base_url)
-        
-        # Step 1: Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
+        page = dash
+
+        sync_button = page.locator(selectors.SYNC_BTN)
         expect(sync_button).to_be_visible()
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        
-        # Wait for classification to complete
-        page.wait_for_timeout(3000)
-        
-        # Step 2: Verify emails are displayed
-        email_cards = page.locator(".email-card")
-        # At least check that the page has loaded properly
-        
-        # Step 3: Find an email with a suggested reply (classified email)
-        view_details_button = page.locator("button:has-text('View Details')")
-        
+        _submit(page, sync_button, "**/emails/sync")
+        expect(page.locator(".email-card, .empty-inbox").first).to_be_visible(timeout=15000)
+
+    def test_view_details_shows_reply_form(self, dash: Page, base_url: str, selectors, seeded_inbox):
+        """
+        Verify that opening a classified email's details reveals the reply
+        section (either the reply form or its empty state).
+        """
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        view_details_button = page.locator(selectors.VIEW_DETAILS)
+        if view_details_button.count() > 0:
+            email_id = _expect_details_visible(page, view_details_button.first)
+            expect(
+                page.locator(f"#details-{email_id} .reply-form, #details-{email_id} .empty-state")
+            ).to_be_visible()
+
+    def test_edit_and_send_shows_confirmation(self, dash: Page, base_url: str, selectors, seeded_inbox):
+        """
+        Verify that editing a suggested reply and sending it confirms the
+        send in place: the form posts via fetch and a success toast appears.
+        """
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        view_details_button = page.locator(selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
-            # Step 4: View details
-            view_details_button.first.click()
-            page.wait_for_timeout(500)
-            
-            # Step 5: Verify reply form is visible
+            _expect_details_visible(page, view_details_button.first)
+
             reply_textarea = page.locator("textarea[name='reply_body']")
             if reply_textarea.count() > 0:
-                # Step 6: Edit reply
+                # Edit reply
                 original_text = reply_textarea.first.input_value()
                 edited_text = f"{original_text}\n\nBest regards,\nTest User"
                 reply_textarea.first.fill(edited_text)
-                
-                # Step 7: Send reply
-                send_button = page.locator("button:has-text('Send Reply')")
+
+                # Send reply; script.js posts it via fetch and surfaces the
+                # outcome as a toast, so that's the signal to wait on.
+                send_button = page.locator(selectors.SEND)
                 if send_button.count() > 0:
-                    send_button.first.click()
-                    page.wait_for_load_state("networkidle")
-                    
-                    # Step 8: Verify redirect back to dashboard
-                    expect(page).to_have_url(f"{base_url}/")
+                    _submit(page, send_button.first, "**/send")
+                    expect(page.locator(".toast-success").first).to_be_visible()
 
-    def test_workflow_retriage_unclassified_email(self, page: Page, base_url: str):
+    def test_workflow_retriage_unclassified_email(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Test workflow for manually retriaging an unclassified email.
-        
+
         This covers the case where:
         1. Email is synced but not automatically classified
         2. User manually triggers classification
         3. System generates classification and reply
         4. User can then view and send the reply
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
         # Find unclassified email (has "Classify & Reply" button)
-        classify_button = page.locator("button:has-text('Classify & Reply')")
-        
+        classify_button = page.locator(selectors.CLASSIFY)
+
         if classify_button.count() > 0:
-            # Trigger retriage
-            classify_button.first.click()
-            page.wait_for_load_state("networkidle")
-            
-            # Wait for classification
-            page.wait_for_timeout(3000)
-            
-            # Verify email now has "View Details" button (classified)
-            view_details_button = page.locator("button:has-text('View Details')")
-            # The email should now be classified
-
-    def test_workflow_multiple_emails_processing(self, page: Page, base_url: str):
+            # Trigger retriage; script.js re-renders the grid once the
+            # response lands, so wait for the card's View Details button.
+            _submit(page, classify_button.first, "**/retriage")
+            expect(
+                page.locator(selectors.VIEW_DETAILS).first
+            ).to_be_visible(timeout=15000)
+
+    def test_workflow_multiple_emails_processing(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Test workflow for processing multiple emails in sequence.
-        
+
         This ensures the system can handle:
         1. Syncing multiple emails
         2. Classifying all of them
         3. User viewing and sending replies for different emails
         4. System maintaining state correctly
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(3000)
-        
-        # Get all email cards
-        email_cards = page.locator(".email-card")
-        card_count = email_cards.count()
-        
-        if card_count > 1:
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        # Snapshot the cards once: .all() is a single round-trip to the
+        # browser, where count() plus per-index nth() calls each pay one.
+        cards = page.locator(selectors.EMAIL_CARD).all()
+
+        if len(cards) > 1:
             # Process first email
-            first_view_button = email_cards.first.locator("button:has-text('View Details')")
+            first_view_button = cards[0].locator(selectors.VIEW_DETAILS)
             if first_view_button.count() > 0:
-                first_view_button.click()
-                page.wait_for_timeout(500)
-                
+                first_id = _expect_details_visible(page, first_view_button)
+
                 # Close details
-                hide_button = page.locator("button:has-text('Hide Details')")
+                hide_button = page.locator(selectors.HIDE_DETAILS)
                 if hide_button.count() > 0:
                     hide_button.click()
-            
+                    expect(page.locator(f"#details-{first_id}")).to_be_hidden()
+
             # Process second email
-            second_view_button = email_cards.nth(1).locator("button:has-text('View Details')")
+            second_view_button = cards[1].locator(selectors.VIEW_DETAILS)
             if second_view_button.count() > 0:
-                second_view_button.click()
-                page.wait_for_timeout(500)
+                _expect_details_visible(page, second_view_button)
 
 
+@pytest.mark.xdist_group("persistence")
 class TestDataPersistenceWorkflow:
-    """Tests for data persistence across page loads and operations."""
+    """Tests for data persistence across page loads and operations.
+
+    Grouped for pytest-xdist (--dist loadgroup) so the tests that assert
+    on database state across reloads always run on the same worker and
+    therefore against the same server and database.
+    """
 
-    def test_emails_persist_after_page_reload(self, page: Page, base_url: str):
+    def test_emails_persist_after_page_reload(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Verify that synced emails persist after page reload.
-        
+
         This ensures:
         1. Emails are saved to database
         2. Reloading page shows same emails
         3. Classification data is preserved
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
         # Get email count
-        email_cards_before = page.locator(".email-card").count()
-        
+        email_cards_before = page.locator(selectors.EMAIL_CARD).count()
+
         # Reload page
-        page.reload()
-        page.wait_for_load_state("networkidle")
-        
+        page.reload(wait_until="domcontentloaded")
+
         # Verify emails still exist
-        email_cards_after = page.locator(".email-card").count()
+        email_cards_after = page.locator(selectors.EMAIL_CARD).count()
         assert email_cards_after == email_cards_before
 
-    def test_classification_persists_after_retriage(self, page: Page, base_url: str):
+    def test_classification_persists_after_retriage(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Verify that classification results persist after retriage.
-        
+
         When an email is retriaged:
         1. New classification should be saved
         2. Reloading should show updated classification
         3. Previous classification should be replaced
         """
-        page.goto(base_url)
-        
-        # Sync and classify
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
-        # Find classified email
-        view_details_button = page.locator("button:has-text('View Details')")
-        if view_details_button.count() > 0:
-            # Get email ID
-            email_id = view_details_button.first.get_attribute("data-email-id")
-            
-            # Reload and verify email still classified
-            page.reload()
-            page.wait_for_load_state("networkidle")
-            
-            # Email should still have "View Details" button
-            view_button_after = page.locator(f"button[data-email-id='{email_id}']:has-text('View Details')")
-            # Should still be visible if classification persisted
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        # One evaluate returns every classified email id in a single
+        # browser round-trip, instead of a count(), a get_attribute(), and
+        # a rebuilt per-id selector walk.
+        _classified_ids = (
+            "() => [...document.querySelectorAll('[data-testid=view-details]')]"
+            ".map(e => e.dataset.emailId)"
+        )
+        classified_before = page.evaluate(_classified_ids)
+        if classified_before:
+            # Reload and verify the emails are still classified
+            page.reload(wait_until="domcontentloaded")
+            classified_after = page.evaluate(_classified_ids)
+            assert set(classified_before) <= set(classified_after)
 
 
 class TestErrorHandlingWorkflow:
     """Tests for error handling and edge cases in workflows."""
 
-    def test_workflow_handles_missing_reply_gracefully(self, page: Page, base_url: str):
+    def test_workflow_handles_missing_reply_gracefully(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Verify that the workflow handles emails without suggested replies.
-        
+
         Some emails might not have suggested replies. The UI should:
         1. Show appropriate message
         2. Allow user to trigger reply generation
         3. Handle the case gracefully
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
         # Open details for any email
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
-            view_details_button.first.click()
-            page.wait_for_timeout(500)
-            
+            _expect_details_visible(page, view_details_button.first)
+
             # Check if reply section shows empty state or form
             reply_section = page.locator(".reply-form, .empty-state")
             # Should show either a form or empty state message
@@ -237,94 +245,84 @@ class TestErrorHandlingWorkflow:
 class TestFilteringAndSearchWorkflow:
     """Tests for filtering and searching emails (if implemented)."""
 
-    def test_api_filtering_workflow(self, page: Page, base_url: str):
+    def test_api_filtering_workflow(self, base_url: str, seeded_inbox):
         """
-        Test filtering emails via API and verifying in UI.
-        
-        This tests the integration between:
-        1. API filtering endpoints
-        2. UI display of filtered results
-        3. Filter persistence
+        Test filtering emails via the JSON API.
+
+        The UI has no filtering controls yet, so there is nothing for a
+        browser to verify — the test talks to the API directly, which
+        skips launching a page entirely.
         """
-        # This would test if filtering UI is implemented
-        # For now, we test that the API supports filtering
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        
-        # The UI currently doesn't have filtering, but API does
-        # This test documents the current state
+        with httpx.Client(base_url=base_url) as client:
+            response = client.get("/emails", params={"category": "SALES_LEAD"})
+            assert response.status_code == 200
+            emails = response.json()["emails"]
+            assert all(e["category"] == "SALES_LEAD" for e in emails)
+
+            response = client.get("/emails", params={"is_lead": "true"})
+            assert response.status_code == 200
+            emails = response.json()["emails"]
+            assert all(e["lead_flag"] for e in emails)
 
 
 class TestConcurrentOperationsWorkflow:
     """Tests for handling concurrent or rapid operations."""
 
-    def test_rapid_sync_operations(self, page: Page, base_url: str):
+    def test_rapid_sync_operations(self, dash: Page, base_url: str, selectors):
         """
         Verify that rapid sync operations are handled correctly.
-        
+
         Users might click sync multiple times quickly. The system should:
         1. Handle each request properly
         2. Avoid duplicate emails
         3. Maintain consistent state
         """
-        page.goto(base_url)
-        
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        
-        # Click sync multiple times rapidly
+        page = dash
+
+        sync_button = page.locator(selectors.SYNC_BTN)
+
+        # Click sync repeatedly; each submit waits for its own sync
+        # response, pacing the loop to the server rather than a fixed
+        # sleep. The click auto-waits for the button to be re-enabled
+        # after the previous sync's refresh.
         for _ in range(3):
-            sync_button.click()
-            page.wait_for_timeout(500)
-        
-        # Wait for all operations to complete
-        page.wait_for_load_state("networkidle")
-        
+            _submit(page, sync_button, "**/emails/sync")
+
         # Verify page is still functional
-        expect(page.locator("h2:has-text('Inbox')")).to_be_visible()
+        expect(page.locator(selectors.INBOX_HEADING)).to_be_visible()
 
-    def test_concurrent_view_and_send_operations(self, page: Page, base_url: str):
+    def test_concurrent_view_and_send_operations(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
         Verify that viewing details and sending replies work concurrently.
-        
+
         When multiple emails are being processed:
         1. Each operation should complete independently
         2. No interference between operations
         3. State should remain consistent
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
         # Open multiple email details
-        view_buttons = page.locator("button:has-text('View Details')")
+        view_buttons = page.locator(selectors.VIEW_DETAILS)
         if view_buttons.count() > 1:
             # Open first email
-            view_buttons.first.click()
-            page.wait_for_timeout(300)
-            
+            _expect_details_visible(page, view_buttons.first)
+
             # Open second email (should close first or show both)
-            view_buttons.nth(1).click()
-            page.wait_for_timeout(300)
-            
+            _expect_details_visible(page, view_buttons.nth(1))
+
             # Verify page is still responsive
-            expect(page.locator(".email-card")).to_be_visible()
+            expect(page.locator(selectors.EMAIL_CARD).first).to_be_visible()
 
 
 class TestEndToEndUserJourney:
     """Tests for complete end-to-end user journeys."""
 
-    def test_new_user_first_time_setup(self, page: Page, base_url: str):
+    def test_new_user_first_time_setup(self, dash: Page, base_url: str, selectors):
         """
         Test the journey of a new user using the system for the first time.
-        
+
         New user journey:
         1. Opens dashboard (empty state)
         2. Syncs emails for first time
@@ -332,89 +330,76 @@ class TestEndToEndUserJourney:
         4. Views email details
         5. Sends first reply
         """
-        page.goto(base_url)
-        
+        page = dash
+
         # Step 1: See empty state
         empty_state = page.locator(".empty-inbox, .empty-state-large")
         # Might be empty or might have emails from previous tests
-        
+
         # Step 2: Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
+        sync_button = page.locator(selectors.SYNC_BTN)
+        _submit(page, sync_button, "**/emails/sync")
+        expect(page.locator(".email-card, .empty-inbox").first).to_be_visible(timeout=15000)
+
         # Step 3: Verify emails appear
-        email_cards = page.locator(".email-card")
+        email_cards = page.locator(selectors.EMAIL_CARD)
         # Should have emails now
-        
+
         # Step 4: View details
         if email_cards.count() > 0:
-            view_button = email_cards.first.locator("button:has-text('View Details')")
+            view_button = email_cards.first.locator(selectors.VIEW_DETAILS)
             if view_button.count() == 0:
                 # Try classify button
-                classify_button = email_cards.first.locator("button:has-text('Classify & Reply')")
+                classify_button = email_cards.first.locator(selectors.CLASSIFY)
                 if classify_button.count() > 0:
-                    classify_button.click()
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_timeout(2000)
-            
+                    _submit(page, classify_button, "**/retriage")
+                    expect(
+                        page.locator(selectors.VIEW_DETAILS).first
+                    ).to_be_visible(timeout=15000)
+
             # Now view details
-            view_button = email_cards.first.locator("button:has-text('View Details')")
+            view_button = email_cards.first.locator(selectors.VIEW_DETAILS)
             if view_button.count() > 0:
-                view_button.click()
-                page.wait_for_timeout(500)
-                
+                _expect_details_visible(page, view_button)
+
                 # Step 5: Send reply if available
-                send_button = page.locator("button:has-text('Send Reply')")
+                send_button = page.locator(selectors.SEND)
                 if send_button.count() > 0:
-                    send_button.click()
-                    page.wait_for_load_state("networkidle")
+                    _submit(page, send_button, "**/send")
+
+    def test_classify_button_transitions_to_view_details(self, dash: Page, base_url: str, selectors, seeded_inbox):
+        """
+        Verify that classifying an email swaps its card footer over to the
+        View Details toggle, and that the state survives a reload.
+        """
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        classify_button = page.locator(selectors.CLASSIFY)
+        if classify_button.count() > 0:
+            _submit(page, classify_button.first, "**/retriage")
+            page.reload(wait_until="domcontentloaded")
+            expect(page.locator(selectors.VIEW_DETAILS).first).to_be_visible(timeout=15000)
 
-    def test_power_user_workflow(self, page: Page, base_url: str):
+    def test_review_each_email_details(self, dash: Page, base_url: str, selectors, seeded_inbox):
         """
-        Test the workflow of a power user processing many emails.
-        
-        Power user journey:
-        1. Syncs emails
-        2. Quickly reviews all emails
-        3. Retriages unclassified ones
-        4. Sends replies for multiple emails
-        5. Verifies all operations completed
+        Verify that a user can open the details of several emails in a row.
+
+        Checks the per-card review loop a power user runs through, without
+        sending anything.
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
-        # Get all emails
-        email_cards = page.locator(".email-card")
-        
-        # Process each email
-        for i in range(min(3, email_cards.count())):  # Process up to 3 emails
-            card = email_cards.nth(i)
-            
-            # Check if needs classification
-            classify_button = card.locator("button:has-text('Classify & Reply')")
-            if classify_button.count() > 0:
-                classify_button.click()
-                page.wait_for_load_state("networkidle")
-                page.wait_for_timeout(1000)
-                # Reload to get updated state
-                page.reload()
-                page.wait_for_load_state("networkidle")
-                email_cards = page.locator(".email-card")  # Refresh reference
-            
-            # View and potentially send
-            view_button = card.locator("button:has-text('View Details')")
+        # dash navigated for us; inbox primed via the API by seeded_inbox
+        page = dash
+
+        # Snapshot the cards once: .all() is a single round-trip to the
+        # browser, where count() plus per-index nth() calls each pay one.
+        cards = page.locator(selectors.EMAIL_CARD).all()[:3]  # Review up to 3 emails
+
+        for card in cards:
+            view_button = card.locator(selectors.VIEW_DETAILS)
             if view_button.count() > 0:
-                view_button.click()
-                page.wait_for_timeout(300)
-                
+                _expect_details_visible(page, view_button)
+
                 # Check for send button (but don't actually send to avoid spam)
-                send_button = page.locator("button:has-text('Send Reply')")
+                send_button = page.locator(selectors.SEND)
                 # Just verify it exists, don't click
-
@@ -13,6 +13,45 @@ works correctly from a user's perspective. Tests verify:
 import pytest
 from playwright.sync_api import Page, expect
 
+from tests.e2e.conftest import Selectors
+
+
+def _wait_for_sync_render(page: Page) -> None:
+    """Wait for the dashboard to re-render after a sync or retriage.
+
+    Sync is an AJAX flow: script.js posts the form, then re-renders the
+    grid from GET /emails (polling until background classification
+    settles). The auto-retrying assertion exits as soon as the first card
+    or the empty state lands instead of sleeping a fixed interval.
+    """
+    expect(page.locator(".email-card, .empty-inbox").first).to_be_visible(timeout=15000)
+
+
+@pytest.fixture(scope="class")
+def synced_page(context, base_url: str):
+    """One page per class, synced and classified exactly once.
+
+    The sync click is the slowest action in the suite (it triggers
+    classification server-side), so classes whose tests only need "synced
+    emails exist" share a single sync instead of repeating it per test.
+    Tests re-goto the dashboard to get a fresh render — that is a plain
+    page load against already-synced data, costing milliseconds.
+    """
+    page = context.new_page()
+    page.set_default_timeout(7500)
+    page.set_default_navigation_timeout(10_000)
+    page.goto(base_url, wait_until="domcontentloaded")
+    sync_button = page.locator(Selectors.SYNC_BTN)
+    # script.js AJAXes the sync form — there is no navigation to wait on.
+    # The sync response, then the first View Details toggle (rendered once
+    # the client's /emails polling sees classification settle), mark the
+    # inbox ready for the details/reply tests.
+    with page.expect_response("**/emails/sync", timeout=15000):
+        sync_button.click()
+    expect(page.locator(Selectors.VIEW_DETAILS).first).to_be_visible(timeout=15000)
+    yield page
+    page.close()
+
 
 class TestDashboardRendering:
     """Tests for dashboard page rendering and initial state."""
@@ -36,7 +75,7 @@ class TestDashboardRendering:
         expect(page.locator("h2:has-text('Inbox')")).to_be_visible()
         
         # Check for sync button
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
+        sync_button = page.locator(Selectors.SYNC_BTN)
         expect(sync_button).to_be_visible()
 
     def test_dashboard_shows_empty_state_when_no_emails(self, page: Page, base_url: str):
@@ -72,6 +111,7 @@ class TestDashboardRendering:
         expect(email_count).to_be_visible()
 
 
+@pytest.mark.xdist_group(name="TestEmailSyncUI")
 class TestEmailSyncUI:
     """Tests for email synchronization from the UI."""
 
@@ -87,18 +127,18 @@ class TestEmailSyncUI:
         page.goto(base_url)
         
         # Click sync button and wait for the response
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
+        sync_button = page.locator(Selectors.SYNC_BTN)
         expect(sync_button).to_be_visible()
         
-        # Wait for navigation after form submission (with longer timeout for LLM processing)
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click(timeout=60000)
-        
-        # Verify we're back on the dashboard
+        # script.js posts the sync form via fetch; wait on the response
+        # rather than a navigation that never happens
+        with page.expect_response("**/emails/sync"):
+            sync_button.click()
+
+        # No navigation occurs; the page stays on the dashboard
         expect(page).to_have_url(f"{base_url}/")
         
-        # Wait a bit more for any async operations to complete
-        page.wait_for_timeout(1000)
+        _wait_for_sync_render(page)
 
     def test_sync_button_shows_loading_state(self, page: Page, base_url: str):
         """
@@ -111,24 +151,29 @@ class TestEmailSyncUI:
         """
         page.goto(base_url)
         
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
+        sync_button = page.locator(Selectors.SYNC_BTN)
         expect(sync_button).to_be_visible()
         
-        # Click and wait for navigation (with timeout for slow operations)
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
+        # Click and wait for the AJAX sync round-trip to come back
+        with page.expect_response("**/emails/sync"):
             sync_button.click()
-        
-        # Verify button exists (loading state might be too brief to catch reliably)
-        expect(sync_button).to_be_visible()
+
+        # The loading state itself is too brief to catch reliably over the
+        # wire (that belongs to a template/script unit test); all E2E can
+        # pin down is that the redirected page re-rendered a sync button.
+        # A fresh locator with a tight timeout keeps a failure here from
+        # burning the full default retry budget.
+        expect(page.locator(Selectors.SYNC_BTN)).to_be_visible(timeout=2000)
 
 
+@pytest.mark.xdist_group(name="TestEmailCardDisplay")
 class TestEmailCardDisplay:
     """Tests for email card rendering and display."""
 
-    def test_email_cards_display_after_sync(self, page: Page, base_url: str):
+    def test_email_cards_display_after_sync(self, page: Page, base_url: str, seeded_inbox):
         """
         Verify that email cards appear after syncing emails.
-        
+
         After syncing, the dashboard should display:
         - Email cards in a grid
         - Sender information
@@ -136,14 +181,10 @@ class TestEmailCardDisplay:
         - Date received
         - Category badges (if classified)
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click()
-        page.wait_for_timeout(2000)  # Wait for classification
-        
+        # The inbox is seeded through the API; this test's subject is the
+        # rendered cards, not the sync flow itself.
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Check for email cards
         email_cards = page.locator(".email-card")
         
@@ -155,25 +196,20 @@ class TestEmailCardDisplay:
             expect(email_cards.first.locator(".sender-name, .email-sender")).to_be_visible()
             expect(email_cards.first.locator(".email-subject, h3")).to_be_visible()
 
-    def test_email_cards_show_category_badges(self, page: Page, base_url: str):
+    def test_email_cards_show_category_badges(self, page: Page, base_url: str, seeded_inbox):
         """
         Verify that email cards display category badges when emails are classified.
-        
+
         Classified emails should show:
         - Category badge with icon
         - Lead badge (if applicable)
         - Priority badge (if applicable)
         """
-        page.goto(base_url)
-        
-        # Sync and wait for classification
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        
-        # Wait a bit for classification to complete
-        page.wait_for_timeout(2000)
-        
+        # Seeded and classified through the API; only the badge render is
+        # under test here.
+        page.goto(base_url, wait_until="domcontentloaded")
+
+
         email_cards = page.locator(".email-card")
         if email_cards.count() > 0:
             # Check for badges (they might not all have categories)
@@ -181,10 +217,11 @@ class TestEmailCardDisplay:
             # At least the structure should be there
 
 
+@pytest.mark.xdist_group(name="TestEmailDetailsToggle")
 class TestEmailDetailsToggle:
     """Tests for viewing and hiding email details."""
 
-    def test_view_details_button_toggles_details(self, page: Page, base_url: str):
+    def test_view_details_button_toggles_details(self, synced_page: Page, base_url: str):
         """
         Verify that clicking "View Details" shows/hides email details.
         
@@ -194,16 +231,11 @@ class TestEmailDetailsToggle:
         - Email body should be displayed
         - Suggested reply form should be visible (if reply exists)
         """
-        page.goto(base_url)
-        
-        # Sync emails first
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)  # Wait for classification
-        
+        page = synced_page
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Find an email card with "View Details" button
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(Selectors.VIEW_DETAILS)
         
         if view_details_button.count() > 0:
             first_button = view_details_button.first
@@ -225,7 +257,7 @@ class TestEmailDetailsToggle:
             # Details should be hidden
             expect(details_section).to_be_hidden()
 
-    def test_details_section_shows_email_content(self, page: Page, base_url: str):
+    def test_details_section_shows_email_content(self, synced_page: Page, base_url: str):
         """
         Verify that the details section displays the full email content.
         
@@ -234,16 +266,11 @@ class TestEmailDetailsToggle:
         - Suggested reply textarea (if reply exists)
         - Send reply button (if reply exists)
         """
-        page.goto(base_url)
-        
-        # Sync and classify
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
+        page = synced_page
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Open details for an email
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(Selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
             view_details_button.first.click()
             
@@ -253,6 +280,7 @@ class TestEmailDetailsToggle:
                 expect(email_content.first).to_be_visible()
 
 
+@pytest.mark.xdist_group(name="TestEmailRetriageUI")
 class TestEmailRetriageUI:
     """Tests for retriaging emails from the UI."""
 
@@ -267,55 +295,54 @@ class TestEmailRetriageUI:
         """
         page.goto(base_url)
         
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
+        # Sync emails; the form posts via fetch, so wait on the response
+        sync_button = page.locator(Selectors.SYNC_BTN)
+        with page.expect_response("**/emails/sync"):
             sync_button.click()
-        page.wait_for_timeout(2000)  # Wait for classification
+        _wait_for_sync_render(page)
         
         # Find "Classify & Reply" button (for unclassified emails)
-        classify_button = page.locator("button:has-text('Classify & Reply')")
+        classify_button = page.locator(Selectors.CLASSIFY)
         
         if classify_button.count() > 0:
-            # Click to retriage (with longer timeout for LLM processing)
-            with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-                classify_button.first.click(timeout=60000)
-            
-            # Verify we're back on dashboard
+            # Click to retriage; script.js posts it via fetch and
+            # re-renders the grid from /emails when the response lands
+            with page.expect_response("**/retriage"):
+                classify_button.first.click()
+
+            # No navigation occurs; the page stays on the dashboard
             expect(page).to_have_url(f"{base_url}/")
 
-    def test_classify_button_only_shows_for_unclassified_emails(self, page: Page, base_url: str):
+    def test_classify_button_only_shows_for_unclassified_emails(self, page: Page, base_url: str, seeded_inbox):
         """
         Verify that "Classify & Reply" button only appears for unclassified emails.
-        
+
         Email cards should show:
         - "Classify & Reply" button if category is missing
         - "View Details" button if category exists
         """
-        page.goto(base_url)
+        # Seeded through the API; this test only reads the rendered footer.
+        page.goto(base_url, wait_until="domcontentloaded")
         
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click()
-        page.wait_for_timeout(2000)  # Wait for classification
-        
-        email_cards = page.locator(".email-card")
-        if email_cards.count() > 0:
-            # Check that each card has either "Classify & Reply" or "View Details"
-            for i in range(email_cards.count()):
-                card = email_cards.nth(i)
-                classify_btn = card.locator("button:has-text('Classify & Reply')")
-                view_btn = card.locator("button:has-text('View Details')")
-                
-                # At least one should exist
-                assert classify_btn.count() > 0 or view_btn.count() > 0
+        # Snapshot every card's footer buttons in one evaluate call; the
+        # nth/count/locator loop this replaces cost four browser round
+        # trips per card.
+        cards = page.evaluate(
+            """() => [...document.querySelectorAll('.email-card')].map(card => ({
+                classify: !!card.querySelector('[data-testid=classify-reply]'),
+                view: !!card.querySelector('[data-testid=view-details]'),
+            }))"""
+        )
+        # Each card must offer exactly one of the two actions
+        for card in cards:
+            assert card["classify"] or card["view"]
 
 
+@pytest.mark.xdist_group(name="TestReplySendingUI")
 class TestReplySendingUI:
     """Tests for sending replies from the UI."""
 
-    def test_send_reply_button_sends_reply(self, page: Page, base_url: str):
+    def test_send_reply_button_sends_reply(self, synced_page: Page, base_url: str):
         """
         Verify that clicking "Send Reply" sends the email reply.
         
@@ -324,32 +351,29 @@ class TestReplySendingUI:
         - Page should redirect back to dashboard
         - Reply should be sent via the email provider
         """
-        page.goto(base_url)
-        
-        # Sync and classify to get a reply
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click()
-        page.wait_for_timeout(2000)  # Wait for classification
-        
+        page = synced_page
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Open details for an email with a reply
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(Selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
-            view_details_button.first.click()
-            page.wait_for_timeout(500)
+            first_button = view_details_button.first
+            email_id = first_button.get_attribute("data-email-id")
+            first_button.click()
+            expect(page.locator(f"#details-{email_id}")).to_be_visible()
             
             # Look for send reply button
-            send_button = page.locator("button:has-text('Send Reply')")
+            send_button = page.locator(Selectors.SEND)
             
             if send_button.count() > 0:
-                # Click to send (with navigation wait)
-                with page.expect_navigation(timeout=30000, wait_until="domcontentloaded"):
+                # Click to send; the reply form posts via fetch too
+                with page.expect_response("**/send"):
                     send_button.first.click()
-                
-                # Verify we're back on dashboard
+
+                # No navigation occurs; the page stays on the dashboard
                 expect(page).to_have_url(f"{base_url}/")
 
-    def test_reply_textarea_is_editable(self, page: Page, base_url: str):
+    def test_reply_textarea_is_editable(self, synced_page: Page, base_url: str):
         """
         Verify that the reply textarea allows editing before sending.
         
@@ -358,16 +382,11 @@ class TestReplySendingUI:
         - Modify the content before sending
         - See their changes in the textarea
         """
-        page.goto(base_url)
-        
-        # Sync and classify
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        sync_button.click()
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
+        page = synced_page
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Open details
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(Selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
             view_details_button.first.click()
             
@@ -384,7 +403,7 @@ class TestReplySendingUI:
                 textarea.fill("Edited reply text")
                 expect(textarea).to_have_value("Edited reply text")
 
-    def test_send_reply_with_edited_text(self, page: Page, base_url: str):
+    def test_send_reply_with_edited_text(self, synced_page: Page, base_url: str):
         """
         Verify that edited reply text is sent correctly.
         
@@ -392,19 +411,16 @@ class TestReplySendingUI:
         - The edited text should be submitted
         - Not the original suggested reply
         """
-        page.goto(base_url)
-        
-        # Sync and classify
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click()
-        page.wait_for_timeout(2000)
-        
+        page = synced_page
+        page.goto(base_url, wait_until="domcontentloaded")
+
         # Open details
-        view_details_button = page.locator("button:has-text('View Details')")
+        view_details_button = page.locator(Selectors.VIEW_DETAILS)
         if view_details_button.count() > 0:
-            view_details_button.first.click()
-            page.wait_for_timeout(500)
+            first_button = view_details_button.first
+            email_id = first_button.get_attribute("data-email-id")
+            first_button.click()
+            expect(page.locator(f"#details-{email_id}")).to_be_visible()
             
             # Edit reply
             reply_textarea = page.locator("textarea[name='reply_body']")
@@ -413,12 +429,13 @@ class TestReplySendingUI:
                 reply_textarea.first.fill(edited_text)
                 
                 # Send (with navigation wait)
-                send_button = page.locator("button:has-text('Send Reply')")
+                send_button = page.locator(Selectors.SEND)
                 if send_button.count() > 0:
-                    with page.expect_navigation(timeout=30000, wait_until="domcontentloaded"):
+                    with page.expect_response("**/send"):
                         send_button.first.click()
 
 
+@pytest.mark.xdist_group(name="TestUIInteractions")
 class TestUIInteractions:
     """Tests for general UI interactions and behavior."""
 
@@ -433,15 +450,17 @@ class TestUIInteractions:
         """
         page.goto(base_url)
         
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
+        sync_button = page.locator(Selectors.SYNC_BTN)
         
-        # Sync multiple times
+        # Sync multiple times; each click waits for its own sync
+        # response, and click auto-waits for the button to re-enable
+        # after the previous refresh
         for _ in range(2):
-            sync_button.click()
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(1000)
+            with page.expect_response("**/emails/sync"):
+                sync_button.click()
+            _wait_for_sync_render(page)
 
-    def test_email_cards_have_correct_structure(self, page: Page, base_url: str):
+    def test_email_cards_have_correct_structure(self, page: Page, base_url: str, seeded_inbox):
         """
         Verify that email cards have all required UI elements.
         
@@ -451,13 +470,8 @@ class TestUIInteractions:
         - Footer with action buttons
         - Badges for classification
         """
-        page.goto(base_url)
-        
-        # Sync emails
-        sync_button = page.locator("button:has-text('Sync Latest Emails')")
-        with page.expect_navigation(timeout=60000, wait_until="domcontentloaded"):
-            sync_button.click()
-        page.wait_for_timeout(2000)  # Wait for classification
+        # Seeded through the API; the card markup is what is under test.
+        page.goto(base_url, wait_until="domcontentloaded")
         
         email_cards = page.locator(".email-card")
         if email_cards.count() > 0:
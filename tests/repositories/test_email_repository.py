@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.email import Email
+from app.repositories.email_repository import EmailRepository
+
+
+def make_email(idx: int) -> Email:
+    return Email(
+        provider_id=f"mock-{idx}",
+        sender="from@example.com",
+        recipients="to@example.com",
+        subject=f"Hi {idx}",
+        snippet="Snippet",
+        body="Body",
+        received_at=datetime.now(tz=timezone.utc),
+    )
+
+
+def test_list_emails_issues_a_single_query() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        repo = EmailRepository(session)
+        for idx in range(10):
+            session.add(make_email(idx))
+        session.commit()
+
+        statements: list[str] = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_queries(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        emails = repo.list_emails()
+        # Touch every column to make sure nothing lazy-loads per row.
+        for email in emails:
+            _ = (email.subject, email.category, email.extracted_entities)
+
+        assert len(emails) == 10
+        assert len(statements) <= 2
+
+
+def test_change_stamp_moves_on_value_only_retriage() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        repo = EmailRepository(session)
+        email = make_email(0)
+        session.add(email)
+        session.commit()
+        repo.save_classification(
+            email,
+            lead_flag=False,
+            category="OTHER",
+            priority="low",
+            entities=None,
+            status="no_reply_needed",
+        )
+        before = repo.change_stamp()
+
+        # Retriage that rewrites only the classification values: the status
+        # stays no_reply_needed, no reply is drafted, and no row is added,
+        # so every count- and timestamp-based term stays put.
+        repo.save_classification(
+            email,
+            lead_flag=False,
+            category="INTERNAL",
+            priority="low",
+            entities={"company": "Acme"},
+            status="no_reply_needed",
+        )
+        assert repo.change_stamp() != before
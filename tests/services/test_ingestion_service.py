@@ -1,35 +1,41 @@
 from datetime import datetime
 
-from datetime import datetime
-
 from app.providers.email.base import EmailMessage
 from app.repositories.email_repository import EmailRepository
 from app.services.ingestion_service import IngestionService
 
+# Fixture messages built once at import; one shared timestamp instead of a
+# datetime.utcnow() call per message per test.
+_NOW = datetime.utcnow()
+_MESSAGES = tuple(
+    EmailMessage(
+        provider_id=str(idx),
+        thread_id=None,
+        sender="from@example.com",
+        recipients=["to@example.com"],
+        cc=[],
+        subject="Hi",
+        snippet="Snippet",
+        body="Body",
+        received_at=_NOW,
+    )
+    for idx in range(10)
+)
+
 
 class FakeProvider:
     def list_recent_messages(self, *, limit: int = 10):
-        for idx in range(limit):
-            yield EmailMessage(
-                provider_id=str(idx),
-                thread_id=None,
-                sender="from@example.com",
-                recipients=["to@example.com"],
-                cc=[],
-                subject="Hi",
-                snippet="Snippet",
-                body="Body",
-                received_at=datetime.utcnow(),
-            )
+        return iter(_MESSAGES[:limit])
 
 
 class FakeRepository(EmailRepository):
     def __init__(self) -> None:
         self.created = 0
+        self.batch_calls = 0
 
-    def create_email(self, **kwargs):  # type: ignore[override]
-        self.created += 1
-        return kwargs
+    def upsert_emails(self, emails):  # type: ignore[override]
+        self.batch_calls += 1
+        self.created += len(list(emails))
 
 
 def test_sync_recent_counts_inserted() -> None:
@@ -40,3 +46,5 @@ def test_sync_recent_counts_inserted() -> None:
 
     assert repo.created == 3
     assert result.synced == 3
+    # The whole sync must land as one batched upsert, not a row at a time.
+    assert repo.batch_calls == 1